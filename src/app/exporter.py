@@ -0,0 +1,189 @@
+"""
+Export module for SpeedRead.
+Renders a reading session offline into an animated GIF or a sequence of PNG
+frames, so it can be watched without the app.
+"""
+
+from typing import Iterable, Iterator, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import io
+import os
+from PIL import Image
+from .frame_renderer import render_word_frame
+
+
+# Fastest speed a GIF can show: frame delays are whole 10 ms steps and most
+# viewers play delays below 20 ms at about 100 ms
+MAX_GIF_WPM = 3000
+
+# Shades from white to black and from white to red, enough for anti-aliased text
+EXPORT_PALETTE = (
+    [channel for i in range(16) for channel in (255 - i * 17,) * 3]
+    + [channel for i in range(16) for channel in (255, 255 - i * 17, 255 - i * 17)]
+)
+
+
+def _palette_image() -> Image.Image:
+    """Create the image holding the fixed export palette."""
+    palette_image = Image.new("P", (1, 1))
+    palette_image.putpalette(EXPORT_PALETTE)
+    return palette_image
+
+
+def split_gif(data: bytes) -> Tuple[bytes, bytes]:
+    """
+    Split a single-frame GIF into its header and its image block.
+
+    Args:
+        data: Encoded GIF with one frame
+
+    Returns:
+        Tuple of (header with global color table, image descriptor and data)
+    """
+    packed = data[10]
+    header_size = 13 + (3 * 2 ** ((packed & 7) + 1) if packed & 0x80 else 0)
+
+    # Skip any extension blocks between the header and the image
+    position = header_size
+    while data[position:position + 1] == b'!':
+        position += 2
+        while data[position]:
+            position += data[position] + 1
+        position += 1
+
+    return data[:header_size], data[position:-1]
+
+
+def _render_batch(words: List[str], size: Tuple[int, int], font_size: int, image_format: str) -> List[bytes]:
+    """Render and encode a batch of frames in a worker process."""
+    palette_image = _palette_image()
+    encoded = []
+    for word in words:
+        frame = render_word_frame(word, size, font_size)
+        output = io.BytesIO()
+        if image_format == "gif":
+            frame = frame.quantize(palette=palette_image, dither=Image.Dither.NONE)
+            frame.save(output, format="GIF", optimize=False)
+        else:
+            frame.save(output, format="PNG")
+        encoded.append(output.getvalue())
+    return encoded
+
+
+def render_frames(words: Iterable[str], size: Tuple[int, int], font_size: int, image_format: str,
+                  workers: Optional[int] = None, batch_size: int = 64) -> Iterator[bytes]:
+    """
+    Render encoded frames in order on a process pool.
+
+    Only a few batches are in flight at a time, so frames are produced as
+    fast as they are written and never pile up in memory.
+
+    Args:
+        words: Words to render, consumed lazily
+        size: Frame size as (width, height) in pixels
+        font_size: Font size in pixels
+        image_format: "gif" or "png"
+        workers: Number of worker processes, the CPU count by default
+        batch_size: Number of frames rendered per task
+
+    Yields:
+        Encoded frames in word order
+    """
+    workers = workers or os.cpu_count() or 1
+    words = iter(words)
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            while len(pending) < workers * 2:
+                batch = list(islice(words, batch_size))
+                if not batch:
+                    break
+                pending.append(executor.submit(_render_batch, batch, size, font_size, image_format))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+
+def export_reading_session(words: Iterable[str], wpm: int, output_path: str,
+                           size: Tuple[int, int] = (520, 100), font_size: int = 32,
+                           workers: Optional[int] = None) -> Optional[int]:
+    """
+    Export a reading session as an animated GIF or a PNG image sequence.
+
+    A path ending in .gif is written as a looping animation with each word
+    shown for 60000 / wpm milliseconds, up to MAX_GIF_WPM. Any other path is
+    used as a directory of numbered PNG frames, to be assembled at wpm / 60
+    frames per second.
+
+    Args:
+        words: Words to show, consumed lazily
+        wpm: Reading speed in words per minute
+        output_path: GIF file or frame directory to write
+        size: Frame size as (width, height) in pixels
+        font_size: Font size in pixels
+        workers: Number of worker processes, the CPU count by default
+
+    Returns:
+        Number of frames written, or None if the export fails
+    """
+    if wpm < 1:
+        print("Speed must be at least 1 WPM")
+        return None
+    if output_path.lower().endswith(".gif") and wpm > MAX_GIF_WPM:
+        print(f"GIF export supports at most {MAX_GIF_WPM} WPM, export PNG frames for faster speeds")
+        return None
+
+    try:
+        if output_path.lower().endswith(".gif"):
+            frame_count = _write_gif(words, wpm, output_path, size, font_size, workers)
+        else:
+            frame_count = _write_png_sequence(words, output_path, size, font_size, workers)
+    except Exception as e:
+        print(f"Error exporting reading session: {e}")
+        return None
+
+    print(f"Exported {frame_count} frames to {output_path}")
+    return frame_count
+
+
+def _write_gif(words: Iterable[str], wpm: int, output_path: str, size: Tuple[int, int],
+               font_size: int, workers: Optional[int]) -> int:
+    """Stream frames into a looping GIF. All frames share the fixed palette, so one header fits all."""
+    # GIF delays are in 10 ms units; rounding running totals keeps the overall pace exact.
+    # Up to MAX_GIF_WPM a word lasts at least 2 units, so no delay rounds below 20 ms.
+    word_delay = 60000 / wpm / 10
+    frame_count = 0
+
+    with open(output_path, 'wb') as f:
+        for data in render_frames(words, size, font_size, "gif", workers):
+            header, image_block = split_gif(data)
+            if frame_count == 0:
+                f.write(b"GIF89a" + header[6:])
+                # Loop forever
+                f.write(b"!\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")
+
+            duration = round((frame_count + 1) * word_delay) - round(frame_count * word_delay)
+            f.write(b"!\xf9\x04\x00" + duration.to_bytes(2, 'little') + b"\x00\x00")
+            f.write(image_block)
+            frame_count += 1
+        f.write(b";")
+
+    if frame_count == 0:
+        os.remove(output_path)
+        raise ValueError("no words to export")
+    return frame_count
+
+
+def _write_png_sequence(words: Iterable[str], output_dir: str, size: Tuple[int, int],
+                        font_size: int, workers: Optional[int]) -> int:
+    """Write each frame to a numbered PNG file."""
+    os.makedirs(output_dir, exist_ok=True)
+    frame_count = 0
+    for data in render_frames(words, size, font_size, "png", workers):
+        frame_count += 1
+        with open(os.path.join(output_dir, f"frame_{frame_count:06d}.png"), 'wb') as f:
+            f.write(data)
+    return frame_count
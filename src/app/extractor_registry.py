@@ -0,0 +1,205 @@
+"""
+Extractor registry module for SpeedRead.
+Maps file formats to their extraction backends. Formats are recognized by
+their first bytes rather than trusted from the file name, and a backend's
+module is only imported when a file of its format is first opened.
+"""
+
+from typing import Callable, Iterator, List, Optional, Sequence
+import codecs
+import importlib
+
+
+# Number of bytes read from the start of a file to recognize its format
+SNIFF_BYTES = 2048
+
+# UTF-8 byte order mark, skipped before matching text formats
+UTF8_BOM = b'\xef\xbb\xbf'
+
+
+class ExtractorSpec:
+    """
+    Describes an extraction backend and how to recognize its files.
+
+    Backend functions are named by module and attribute rather than held
+    directly, so registering a format costs nothing until it is used and the
+    functions are looked up afresh on every call.
+    """
+
+    def __init__(self, name: str, label: str, extensions: Sequence[str], module: str,
+                 extract: str, paragraphs: Optional[str] = None, magic: Sequence[bytes] = (),
+                 text: bool = False, streaming: bool = False, parallel: bool = False):
+        """
+        Args:
+            name: Short identifier of the format
+            label: Name of the format shown to the user
+            extensions: File extensions of the format, without the dot
+            module: Module holding the backend, relative to this package or absolute
+            extract: Name of the function returning a file's cleaned words
+            paragraphs: Name of the generator yielding a file's raw paragraphs, if any
+            magic: Byte prefixes that identify the format, compared case-insensitively
+            text: The format is plain text that can be read even when mislabeled
+            streaming: Paragraphs are read incrementally instead of loading the whole file
+            parallel: Cleaning runs on a process pool for large documents
+        """
+        self.name = name
+        self.label = label
+        self.extensions = tuple(extensions)
+        self.module = module
+        self.extract = extract
+        self.paragraphs = paragraphs
+        self.magic = tuple(prefix.lower() for prefix in magic)
+        self.text = text
+        self.streaming = streaming
+        self.parallel = parallel
+
+    def __repr__(self) -> str:
+        return f"ExtractorSpec({self.name!r})"
+
+    def load(self, attribute: str) -> Callable:
+        """Import the backend module if needed and return one of its functions."""
+        module = importlib.import_module(self.module, __package__)
+        return getattr(module, attribute)
+
+    def extract_function(self) -> Callable[[str, str], Optional[List[str]]]:
+        """Return the function extracting a file's cleaned words."""
+        return self.load(self.extract)
+
+    def paragraph_reader(self) -> Optional[Callable[[str], Iterator[List[str]]]]:
+        """Return the generator reading a file's raw paragraphs, or None if there is none."""
+        return self.load(self.paragraphs) if self.paragraphs else None
+
+
+# Registered formats, matched in registration order
+_extractors: List[ExtractorSpec] = []
+
+
+def register_extractor(spec: ExtractorSpec):
+    """
+    Register an extraction backend. A spec with the same name replaces the old one.
+
+    Args:
+        spec: Backend to register
+    """
+    for index, registered in enumerate(_extractors):
+        if registered.name == spec.name:
+            _extractors[index] = spec
+            return
+    _extractors.append(spec)
+
+
+def get_extractor(name: str) -> Optional[ExtractorSpec]:
+    """Find a registered backend by name."""
+    for spec in _extractors:
+        if spec.name == name:
+            return spec
+    return None
+
+
+def get_file_extension(file_path: str) -> str:
+    """Return the lowercase extension of a file, without the dot."""
+    return file_path.lower().split('.')[-1]
+
+
+def looks_like_text(sample: bytes) -> bool:
+    """
+    Check whether the start of a file is UTF-8 text.
+
+    Args:
+        sample: First bytes of the file; a character cut off at the end is allowed
+
+    Returns:
+        True if the sample has no NUL bytes and decodes as UTF-8
+    """
+    if b'\x00' in sample:
+        return False
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def sniff_extractor(sample: bytes) -> Optional[ExtractorSpec]:
+    """
+    Recognize a format from the first bytes of a file.
+
+    Args:
+        sample: First bytes of the file
+
+    Returns:
+        The matching backend, or None if no magic bytes match
+    """
+    if sample.startswith(UTF8_BOM):
+        sample = sample[len(UTF8_BOM):]
+    binary_sample = sample.lower()
+    # Markup may be preceded by whitespace, binary signatures never are
+    text_sample = binary_sample.lstrip()
+    for spec in _extractors:
+        candidate = text_sample if spec.text else binary_sample
+        if any(candidate.startswith(prefix) for prefix in spec.magic):
+            return spec
+    return None
+
+
+def find_extractor(file_path: str, sample: Optional[bytes] = None) -> Optional[ExtractorSpec]:
+    """
+    Choose the backend for a file from its content, falling back to its extension.
+
+    Files with known magic bytes go to their format regardless of their name.
+    Text that carries the extension of a binary format is read as plain text
+    instead of failing in the binary backend. Empty and unreadable files are
+    matched by extension.
+
+    Args:
+        file_path: Path to the file
+        sample: First bytes of the file, read from the file if not given
+
+    Returns:
+        The backend to use, or None if the format is not supported
+    """
+    if sample is None:
+        try:
+            with open(file_path, 'rb') as f:
+                sample = f.read(SNIFF_BYTES)
+        except OSError:
+            sample = b''
+
+    spec = sniff_extractor(sample)
+    if spec is not None:
+        return spec
+
+    extension = get_file_extension(file_path)
+    by_extension = next((spec for spec in _extractors if extension in spec.extensions), None)
+    if sample and looks_like_text(sample) and (by_extension is None or not by_extension.text):
+        return get_extractor("txt")
+    return by_extension
+
+
+def registered_extractors() -> List[ExtractorSpec]:
+    """Return the registered backends in matching order."""
+    return list(_extractors)
+
+
+# Built-in formats
+register_extractor(ExtractorSpec(
+    "pdf", "PDF", ["pdf"], ".text_extractor", "extract_text_from_pdf", "iter_pdf_paragraphs",
+    magic=[b"%PDF-"], streaming=True, parallel=True,
+))
+register_extractor(ExtractorSpec(
+    # .docx files are ZIP archives, .doc files are OLE compound documents
+    "word", "Word", ["doc", "docx"], ".text_extractor", "extract_text_from_word",
+    magic=[b"PK\x03\x04", b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"],
+))
+register_extractor(ExtractorSpec(
+    "html", "HTML", ["html", "htm"], ".text_extractor", "extract_text_from_html", "iter_html_paragraphs",
+    magic=[b"<!doctype html", b"<html", b"<head", b"<body"], text=True, streaming=True, parallel=True,
+))
+register_extractor(ExtractorSpec(
+    "markdown", "Markdown", ["md", "markdown"], ".text_extractor", "extract_text_from_markdown",
+    "iter_markdown_paragraphs", text=True, streaming=True, parallel=True,
+))
+register_extractor(ExtractorSpec(
+    "txt", "Text", ["txt"], ".text_extractor", "extract_text_from_txt", "iter_txt_paragraphs",
+    text=True, streaming=True, parallel=True,
+))
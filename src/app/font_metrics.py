@@ -0,0 +1,71 @@
+"""
+Font metrics module for SpeedRead.
+Measures text widths once per font and string, so words can be centered
+exactly on their highlighted letter without a layout pass on every tick.
+"""
+
+from typing import Tuple
+from collections import OrderedDict
+
+
+class FontMetrics:
+    """
+    Bounded cache of text widths for one font.
+
+    Widths come from the font's measure() method, e.g. tkinter.font.Font,
+    which asks Tk once per string. Reading repeats words constantly, so
+    most lookups are served from the cache.
+    """
+
+    def __init__(self, font, capacity: int = 4096):
+        """
+        Args:
+            font: Font with a measure(text) method returning a width in pixels
+            capacity: Maximum number of strings whose widths are kept
+        """
+        self.font = font
+        self.capacity = capacity
+        self._widths = OrderedDict()
+
+    def measure(self, text: str) -> int:
+        """
+        Return the width of a string in pixels.
+
+        Args:
+            text: String to measure
+
+        Returns:
+            Width in pixels when drawn in this font
+        """
+        width = self._widths.get(text)
+        if width is not None:
+            self._widths.move_to_end(text)
+            return width
+
+        width = self.font.measure(text)
+        self._widths[text] = width
+        if len(self._widths) > self.capacity:
+            self._widths.popitem(last=False)
+        return width
+
+    def center_bounds(self, center_x: float, center: str) -> Tuple[float, float]:
+        """
+        Find where to draw a letter so that it is centered on a point.
+
+        The text before the letter ends at the left bound and the text after
+        it starts at the right bound.
+
+        Args:
+            center_x: Horizontal position to center the letter on
+            center: Letter to center
+
+        Returns:
+            Tuple of (left edge, right edge) of the letter
+        """
+        width = self.measure(center)
+        left = center_x - width / 2
+        return left, left + width
+
+    def clear(self):
+        """Forget all measured widths, e.g. after the font was reconfigured."""
+        self._widths.clear()
@@ -0,0 +1,200 @@
+"""
+Frame rendering module for SpeedRead.
+Rasterizes words into image frames with Pillow so playback can swap
+pre-built images instead of laying out text on every tick.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+from functools import lru_cache
+import threading
+from PIL import Image, ImageDraw, ImageFont
+
+
+# Monospace fonts tried in order before falling back to Pillow's default font
+FONT_CANDIDATES = [
+    "cour.ttf",
+    "Courier New.ttf",
+    "Courier.ttc",
+    "DejaVuSansMono.ttf",
+    "LiberationMono-Regular.ttf",
+]
+
+
+def split_word(word: str) -> Tuple[str, str, str]:
+    """
+    Split a word around its center letter.
+
+    Args:
+        word: Word to split (must not be empty)
+
+    Returns:
+        Tuple of (before, center letter, after)
+    """
+    center_index = len(word) // 2
+    return word[:center_index], word[center_index], word[center_index + 1:]
+
+
+@lru_cache(maxsize=8)
+def load_font(font_size: int = 32) -> ImageFont.FreeTypeFont:
+    """
+    Load a monospace TrueType font, falling back to Pillow's default font.
+
+    Args:
+        font_size: Font size in pixels
+
+    Returns:
+        Loaded font
+    """
+    for name in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(name, font_size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=font_size)
+
+
+def render_word_frame(word: str, size: Tuple[int, int], font_size: int = 32,
+                      background: str = "white", text_color: str = "black",
+                      highlight_color: str = "red") -> Image.Image:
+    """
+    Render a word with its center letter highlighted, as shown during playback.
+
+    Args:
+        word: Word to render
+        size: Frame size as (width, height) in pixels
+        font_size: Font size in pixels
+        background: Background color
+        text_color: Color of the letters around the center letter
+        highlight_color: Color of the center letter
+
+    Returns:
+        Rendered RGB image
+    """
+    image = Image.new("RGB", size, background)
+    draw = ImageDraw.Draw(image)
+    font = load_font(font_size)
+    before, center, after = split_word(word)
+
+    # Center letter sits in the middle of the frame, the rest hangs off its edges
+    center_y = size[1] / 2
+    center_width = font.getlength(center)
+    center_left = size[0] / 2 - center_width / 2
+
+    draw.text((center_left, center_y), center, font=font, fill=highlight_color, anchor="lm")
+    if before:
+        draw.text((center_left, center_y), before, font=font, fill=text_color, anchor="rm")
+    if after:
+        draw.text((center_left + center_width, center_y), after, font=font, fill=text_color, anchor="lm")
+
+    return image
+
+
+class FrameCache:
+    """
+    Bounded ring buffer of word frames rendered ahead of playback on a
+    background thread.
+    """
+
+    def __init__(self, words: Sequence[str], size: Tuple[int, int],
+                 capacity: int = 64, font_size: int = 32):
+        self.words = words
+        self.size = size
+        self.capacity = capacity
+        self.font_size = font_size
+
+        self._slots: List[Optional[Tuple[int, Image.Image]]] = [None] * capacity
+        self._condition = threading.Condition()
+        self._read_index = 0  # First index playback may still ask for
+        self._write_index = 0  # Next index the renderer will produce
+        self._generation = 0  # Bumped on every seek so stale renders are dropped
+        self._running = False
+        self._thread = None
+
+    def start(self, index: int = 0):
+        """Start rendering frames from the given word index."""
+        with self._condition:
+            self._reset(index)
+            self._running = True
+        self._thread = threading.Thread(target=self._render_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the render thread and wait for it to exit."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def seek(self, index: int):
+        """Restart rendering from a new word index, e.g. after a rewind."""
+        with self._condition:
+            if not self._read_index <= index <= self._write_index:
+                self._reset(index)
+            else:
+                self._read_index = index
+                self._condition.notify_all()
+
+    def replace_words(self, words: Sequence[str], index: int):
+        """Switch to a new word list and restart rendering from index."""
+        with self._condition:
+            self.words = words
+            self._reset(index)
+
+    def wake(self):
+        """Wake the render thread after words have been appended."""
+        with self._condition:
+            self._condition.notify_all()
+
+    def get(self, index: int) -> Optional[Image.Image]:
+        """
+        Take the pre-rendered frame for a word index.
+
+        Args:
+            index: Word index to fetch
+
+        Returns:
+            The rendered frame, or None if it is not ready yet. On a miss the
+            renderer skips ahead to the following word so it catches up.
+        """
+        with self._condition:
+            entry = self._slots[index % self.capacity]
+            if entry is not None and entry[0] == index:
+                self._slots[index % self.capacity] = None
+                self._read_index = index + 1
+                self._condition.notify_all()
+                return entry[1]
+            self._reset(index + 1)
+            return None
+
+    def _reset(self, index: int):
+        """Discard pending frames and continue from index. Caller holds the lock."""
+        self._slots = [None] * self.capacity
+        self._read_index = index
+        self._write_index = index
+        self._generation += 1
+        self._condition.notify_all()
+
+    def _render_loop(self):
+        """Render frames until stopped, staying at most capacity frames ahead."""
+        while True:
+            with self._condition:
+                while self._running and (
+                    self._write_index >= len(self.words)
+                    or self._write_index - self._read_index >= self.capacity
+                ):
+                    self._condition.wait()
+                if not self._running:
+                    return
+                index = self._write_index
+                generation = self._generation
+                word = self.words[index]
+
+            # Rasterize outside the lock so playback never waits on Pillow
+            image = render_word_frame(word, self.size, self.font_size)
+
+            with self._condition:
+                if generation == self._generation:
+                    self._slots[index % self.capacity] = (index, image)
+                    self._write_index = index + 1
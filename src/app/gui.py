@@ -4,9 +4,25 @@ Contains the main application window and GUI components.
 """
 
 import customtkinter as ctk
+import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import PhotoImage
+from PIL import ImageTk
 import os
-from .text_extractor import extract_text
+from .text_extractor import extract_document, clean_paragraphs, find_paragraph_split
+from .text_index import TextIndex
+from .extractor_registry import find_extractor
+from .frame_renderer import FrameCache, render_word_frame, split_word
+from .word_buffer import WordBuffer
+from .word_timing import AdaptiveTimer
+from .font_metrics import FontMetrics
+
+
+# Files larger than this are read into a disk-backed word buffer instead of memory
+LARGE_FILE_BYTES = 16 * 1024 * 1024
+
+# Number of raw tokens re-filtered per step after a citation style change
+REFILTER_STEP_TOKENS = 4096
 
 
 class SpeedReadApp(ctk.CTk):
@@ -28,7 +44,7 @@ class SpeedReadApp(ctk.CTk):
         
         # Center window on screen
         window_width = 600
-        window_height = 400
+        window_height = 450
         screen_width = self.winfo_screenwidth()
         screen_height = self.winfo_screenheight()
         x = (screen_width - window_width) // 2
@@ -92,6 +108,15 @@ class SpeedReadApp(ctk.CTk):
         )
         self.text_display.place(relx=0.5, rely=0.5, anchor="center")
         
+        # Font of the word being read, measured once per string for centering
+        scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        self.word_font = tkfont.Font(family="Courier", size=-round(32 * scaling))
+        self.font_metrics = FontMetrics(self.word_font)
+        self.word_labels = None  # (before, center, after) labels reused for every word
+        self.displayed_word = None  # (before, center, after) currently shown
+        self.display_size = (0, 0)  # Display frame size, updated on <Configure>
+        self.text_display_frame.bind("<Configure>", self.on_display_configure, add="+")
+        
         # Citation style selector
         citation_frame = ctk.CTkFrame(self, fg_color="white")
         citation_frame.grid(row=4, column=0, padx=20, pady=(10, 10))
@@ -122,6 +147,7 @@ class SpeedReadApp(ctk.CTk):
                 text=text,
                 variable=self.citation_style,
                 value=value,
+                command=self.apply_citation_style,
                 font=ctk.CTkFont(size=12),
                 text_color="black",
                 fg_color="black",
@@ -178,44 +204,105 @@ class SpeedReadApp(ctk.CTk):
         )
         self.stop_button.grid(row=0, column=3, padx=5)
         
+        # Pre-rendered frame backend toggle
+        self.prerender_enabled = ctk.BooleanVar(value=False)
+        self.prerender_checkbox = ctk.CTkCheckBox(
+            controls_frame,
+            text="Pre-render",
+            variable=self.prerender_enabled,
+            font=ctk.CTkFont(size=12),
+            text_color="black",
+            fg_color="black",
+            hover_color="gray30"
+        )
+        self.prerender_checkbox.grid(row=0, column=4, padx=5)
+        
+        # Per-word pacing toggle, keeps the average at the chosen WPM
+        self.adaptive_enabled = ctk.BooleanVar(value=False)
+        self.adaptive_checkbox = ctk.CTkCheckBox(
+            controls_frame,
+            text="Adaptive",
+            variable=self.adaptive_enabled,
+            font=ctk.CTkFont(size=12),
+            text_color="black",
+            fg_color="black",
+            hover_color="gray30"
+        )
+        self.adaptive_checkbox.grid(row=0, column=5, padx=5)
+        
+        # Sentence and paragraph navigation
+        navigation_frame = ctk.CTkFrame(self, fg_color="white")
+        navigation_frame.grid(row=6, column=0, padx=20, pady=(0, 20))
+        
+        navigation_options = [
+            ("« Paragraph", self.previous_paragraph),
+            ("‹ Sentence", self.previous_sentence),
+            ("Sentence ›", self.next_sentence),
+            ("Paragraph »", self.next_paragraph)
+        ]
+        
+        for idx, (text, command) in enumerate(navigation_options):
+            nav_btn = ctk.CTkButton(
+                navigation_frame,
+                text=text,
+                command=command,
+                width=90,
+                height=28,
+                font=ctk.CTkFont(size=12),
+                fg_color="black",
+                hover_color="gray30"
+            )
+            nav_btn.grid(row=0, column=idx, padx=5)
+        
         self.is_reading = False
         self.selected_file_path = None
         self.word_list = []
+        self.word_timer = None  # Adaptive per-word display times for word_list
+        self.text_index = None
         self.current_word_index = 0
         self.reading_speed_wpm = 120  # Words per minute
+        self.frame_cache = None
+        self.frame_label = None
+        self.current_frame = None
+        self.next_frame = None  # (word index, PhotoImage) prepared for the next tick
+        self.stream_source = None
+        self.stream_status_label = None
+        self.raw_paragraphs = None  # Raw tokens of the loaded file only, re-filtered on style changes
+        self.refilter_steps = None  # Steps re-filtering the rest of the document after a style change
+        self.refilter_after_id = None
     
     def load_file(self, file_path):
         """Load a file and update the UI."""
+        self.close_stream()
         self.selected_file_path = file_path
         filename = file_path.split("/")[-1]
-        file_extension = filename.split(".")[-1].lower()
-        
-        # Determine file type and log to console
-        if file_extension == "txt":
-            file_type = "text"
-            print(f"Text file chosen: {filename}")
-        elif file_extension in ["doc", "docx"]:
-            file_type = "Word"
-            print(f"Word file chosen: {filename}")
-        elif file_extension == "pdf":
-            file_type = "PDF"
-            print(f"PDF file chosen: {filename}")
+        extractor = find_extractor(file_path)
+        
+        # Log the detected file type to console
+        if extractor is not None:
+            print(f"{extractor.label} file chosen: {filename}")
         else:
-            file_type = "unknown"
             print(f"Unknown file type chosen: {filename}")
         
         self.selected_file_label.configure(text=f"Selected: {filename}", text_color="green")
         
         # Extract and display text based on file type
         try:
-            if file_extension in ["txt", "pdf"]:
-                # Use the text extractor for both text and PDF files
+            if extractor is not None and extractor.paragraphs:
+                # Use the text extractor for formats that can be read paragraph by paragraph
                 # Get the selected citation style
                 citation_style = self.citation_style.get()
-                words = extract_text(file_path, citation_style)
+                large = os.path.getsize(file_path) > LARGE_FILE_BYTES
+                buffer = WordBuffer() if large and extractor.streaming else None
+                # Large files are not kept in memory, re-filtering them means reading them again
+                raw_paragraphs = [] if buffer is None else None
+                document = extract_document(file_path, citation_style, buffer, raw_paragraphs)
+                words = document[0] if document else None
                 if words:
-                    self.word_list = words
+                    self.set_word_list(words)
+                    self.text_index = document[1]
                     self.current_word_index = 0
+                    self.raw_paragraphs = raw_paragraphs
                     # Clear display frame
                     for widget in self.text_display_frame.winfo_children():
                         widget.destroy()
@@ -229,6 +316,8 @@ class SpeedReadApp(ctk.CTk):
                     )
                     status_label.place(relx=0.5, rely=0.5, anchor="center")
                 else:
+                    if buffer is not None:
+                        buffer.close()
                     for widget in self.text_display_frame.winfo_children():
                         widget.destroy()
                     error_label = ctk.CTkLabel(
@@ -255,8 +344,154 @@ class SpeedReadApp(ctk.CTk):
             self.selected_file_label.configure(text=f"Error: {str(e)}", text_color="red")
             print(f"Error loading file: {str(e)}")
     
+    def load_stream(self, source, name):
+        """Read words from a streaming source as they arrive."""
+        self.close_stream()
+        self.stream_source = source
+        self.selected_file_path = None
+        # Streams can run indefinitely, so keep their words on disk
+        self.set_word_list(WordBuffer())
+        self.text_index = None
+        self.raw_paragraphs = None
+        self.current_word_index = 0
+        print(f"Streaming from: {name}")
+        
+        self.selected_file_label.configure(text=f"Streaming: {name}", text_color="green")
+        for widget in self.text_display_frame.winfo_children():
+            widget.destroy()
+        self.stream_status_label = ctk.CTkLabel(
+            self.text_display_frame,
+            text="Waiting for input...",
+            font=ctk.CTkFont(family="Courier", size=32),
+            fg_color="white",
+            text_color="black"
+        )
+        self.stream_status_label.place(relx=0.5, rely=0.5, anchor="center")
+        self.poll_stream()
+    
+    def poll_stream(self):
+        """Move newly arrived words from the stream into the word list, up to a lookahead."""
+        source = self.stream_source
+        if source is None:
+            return
+        
+        # Stop taking words far ahead of playback, so the stream's queue fills and its reader waits
+        words = source.read_ahead(len(self.word_list) - self.current_word_index)
+        if words:
+            self.word_list.extend(words)
+            if self.frame_cache is not None:
+                self.frame_cache.wake()
+            if not self.is_reading and self.stream_status_label.winfo_exists():
+                self.stream_status_label.configure(text=f"{len(self.word_list)} words loaded")
+        
+        if source.finished:
+            print(f"Stream ended after {len(self.word_list)} words")
+            self.stream_source = None
+        else:
+            # Poll again right away while words are flowing
+            self.after(10 if words else 100, self.poll_stream)
+    
+    def close_stream(self):
+        """Stop reading the current streaming source, if any."""
+        if self.stream_source is not None:
+            self.stream_source.stop()
+            self.stream_source = None
+    
+    def set_word_list(self, words):
+        """Replace the word list, releasing the spill file of a previous word buffer."""
+        if isinstance(self.word_list, WordBuffer) and self.word_list is not words:
+            self.word_list.close()
+        self.word_list = words
+        self.word_timer = AdaptiveTimer(words)
+        self.cancel_refilter()
+    
+    def apply_citation_style(self):
+        """Re-filter the raw tokens of the loaded file with the selected citation style."""
+        if self.raw_paragraphs is None or self.text_index is None:
+            return
+        
+        citation_style = self.citation_style.get()
+        position = self.reading_position()
+        paragraph = self.text_index.paragraph_of(position)
+        offset = position - self.text_index.paragraph_starts[paragraph] if self.text_index.paragraph_starts else 0
+        source = self.text_index.paragraph_sources[paragraph] if self.text_index.paragraph_sources else 0
+        
+        # Filter a few paragraphs from the reader's position first so playback continues right away
+        end = find_paragraph_split(self.raw_paragraphs, source, REFILTER_STEP_TOKENS)
+        words, text_index = clean_paragraphs(self.raw_paragraphs[source:end], citation_style, first_source=source)
+        paragraph_end = text_index.paragraph_starts[1] if len(text_index.paragraph_starts) > 1 else len(words)
+        self.replace_words(words, text_index, min(offset, max(paragraph_end - 1, 0)))
+        print(f"Citation style changed to {citation_style}")
+        
+        self.refilter_steps = self.refilter_rest(citation_style, source, end)
+        self.refilter_after_id = self.after(1, self.continue_refilter)
+    
+    def refilter_rest(self, citation_style, source, end):
+        """
+        Re-filter the paragraphs outside the first window, one step per call to next().
+        
+        Following paragraphs are appended as they are filtered. Preceding
+        paragraphs are collected separately and prepended in one go at the end.
+        """
+        paragraphs = self.raw_paragraphs
+        while end < len(paragraphs):
+            start, end = end, find_paragraph_split(paragraphs, end, REFILTER_STEP_TOKENS)
+            words, text_index = clean_paragraphs(paragraphs[start:end], citation_style, first_source=start)
+            self.word_list.extend(words)
+            self.text_index = self.text_index.join(text_index)
+            if self.frame_cache is not None:
+                self.frame_cache.wake()
+            yield
+        
+        prefix_words, prefix_index = [], TextIndex()
+        start = 0
+        while start < source:
+            end = min(find_paragraph_split(paragraphs, start, REFILTER_STEP_TOKENS), source)
+            words, text_index = clean_paragraphs(paragraphs[start:end], citation_style, first_source=start)
+            prefix_words.extend(words)
+            prefix_index = prefix_index.join(text_index)
+            start = end
+            yield
+        
+        if prefix_words:
+            self.replace_words(
+                prefix_words + self.word_list,
+                prefix_index.join(self.text_index),
+                self.current_word_index + len(prefix_words)
+            )
+    
+    def continue_refilter(self):
+        """Run one re-filtering step and schedule the next, leaving Tk free in between."""
+        self.refilter_after_id = None
+        steps = self.refilter_steps
+        if steps is None:
+            return
+        try:
+            next(steps)
+        except StopIteration:
+            self.refilter_steps = None
+            return
+        if self.refilter_steps is steps:
+            self.refilter_after_id = self.after(1, self.continue_refilter)
+    
+    def cancel_refilter(self):
+        """Stop re-filtering in the background, e.g. because the word list is replaced."""
+        if self.refilter_after_id is not None:
+            self.after_cancel(self.refilter_after_id)
+            self.refilter_after_id = None
+        self.refilter_steps = None
+    
+    def replace_words(self, words, text_index, index):
+        """Swap in a re-filtered word list, keeping playback going at index."""
+        self.set_word_list(words)
+        self.text_index = text_index
+        self.current_word_index = index
+        if self.frame_cache is not None:
+            self.frame_cache.replace_words(words, index)
+            self.next_frame = None
+    
     def choose_file(self):
-        """Open file dialog to choose a text, Word, or PDF file."""
+        """Open file dialog to choose a text, Word, PDF, HTML or Markdown file."""
         from tkinter import filedialog
         file_path = filedialog.askopenfilename(
             title="Select a file",
@@ -264,7 +499,9 @@ class SpeedReadApp(ctk.CTk):
                 ("Text files", "*.txt"),
                 ("Word files", "*.doc *.docx"),
                 ("PDF files", "*.pdf"),
-                ("All supported files", "*.txt *.doc *.docx *.pdf"),
+                ("HTML files", "*.html *.htm"),
+                ("Markdown files", "*.md *.markdown"),
+                ("All supported files", "*.txt *.doc *.docx *.pdf *.html *.htm *.md *.markdown"),
                 ("All files", "*.*")
             ]
         )
@@ -273,7 +510,7 @@ class SpeedReadApp(ctk.CTk):
     
     def start_reading(self):
         """Start the speed reading session."""
-        if not self.word_list:
+        if not self.word_list and self.stream_source is None:
             print("No text loaded. Please select a file first.")
             return
         
@@ -289,7 +526,9 @@ class SpeedReadApp(ctk.CTk):
             return
         
         self.is_reading = True
-        self.current_word_index = 0
+        # Resume where playback stopped, or start over after finishing
+        if self.current_word_index >= len(self.word_list):
+            self.current_word_index = 0
         self.start_button.configure(state="disabled")
         self.stop_button.configure(state="normal")
         print(f"Reading started at {self.reading_speed_wpm} WPM")
@@ -297,10 +536,33 @@ class SpeedReadApp(ctk.CTk):
         # Clear display and show first word
         for widget in self.text_display_frame.winfo_children():
             widget.destroy()
+        if self.prerender_enabled.get():
+            self.start_frame_cache()
         self.show_next_word()
     
+    def start_frame_cache(self):
+        """Start rendering word frames ahead of playback on a background thread."""
+        width, height = self.display_size
+        size = (max(width, 1), max(height, 1))
+        self.frame_cache = FrameCache(self.word_list, size)
+        self.frame_cache.start(self.current_word_index)
+        self.next_frame = None
+        
+        # Plain tk label: the tick only swaps the image it shows
+        self.frame_label = tk.Label(self.text_display_frame, bg="white", borderwidth=0, highlightthickness=0)
+        self.frame_label.place(relx=0.5, rely=0.5, anchor="center")
+    
     def show_next_word(self):
         """Display the next word in the sequence."""
+        # Calculate delay in milliseconds (60000 ms per minute / WPM)
+        delay_ms = int(60000 / self.reading_speed_wpm)
+        
+        if (self.is_reading and self.current_word_index >= len(self.word_list)
+                and self.stream_source is not None):
+            # Caught up with a live stream, wait for more words
+            self.after(delay_ms, self.show_next_word)
+            return
+        
         if not self.is_reading or self.current_word_index >= len(self.word_list):
             # Reading finished or stopped
             if self.current_word_index >= len(self.word_list):
@@ -309,85 +571,142 @@ class SpeedReadApp(ctk.CTk):
             self.stop_reading()
             return
         
-        # Display current word with center letter highlighted
-        current_word = self.word_list[self.current_word_index]
-        
-        # Calculate center position of the word
-        word_length = len(current_word)
-        center_index = word_length // 2
-        
-        # Split word into parts
-        before = current_word[:center_index]
-        center_letter = current_word[center_index]
-        after = current_word[center_index + 1:]
-        
-        # Create the display text with red letter using unicode or simple concatenation
-        # Since we can't color individual letters in a label, we'll use three separate labels
-        # positioned horizontally
-        self.update_word_display(before, center_letter, after)
+        if self.frame_cache is not None:
+            # Swap in the pre-rendered frame and prepare the next one when idle
+            self.show_word_frame(self.current_word_index)
+            self.after_idle(self.prepare_next_frame)
+        else:
+            # Display current word with center letter highlighted
+            current_word = self.word_list[self.current_word_index]
+            
+            # Split word into parts around its center letter
+            before, center_letter, after = split_word(current_word)
+            
+            # Since we can't color individual letters in a label, we'll use three separate labels
+            # positioned horizontally
+            self.update_word_display(before, center_letter, after)
+        
+        if self.adaptive_enabled.get() and self.word_timer is not None:
+            # Show common words briefly and rare or long ones longer
+            delay_ms = self.word_timer.delay_ms(self.current_word_index, self.reading_speed_wpm)
         
         # Move to next word
         self.current_word_index += 1
         
-        # Calculate delay in milliseconds (60000 ms per minute / WPM)
-        delay_ms = int(60000 / self.reading_speed_wpm)
-        
         # Schedule next word
         self.after(delay_ms, self.show_next_word)
     
+    def build_frame(self, index):
+        """Build a PhotoImage for a word, rendering inline if the cache missed it."""
+        image = self.frame_cache.get(index)
+        if image is None:
+            image = render_word_frame(self.word_list[index], self.frame_cache.size)
+        return ImageTk.PhotoImage(image)
+    
+    def show_word_frame(self, index):
+        """Show the pre-rendered frame for a word index."""
+        if self.next_frame is not None and self.next_frame[0] == index:
+            photo = self.next_frame[1]
+        else:
+            photo = self.build_frame(index)
+        # Keep a reference, Tk blanks images that get garbage collected
+        self.current_frame = photo
+        self.next_frame = None
+        self.frame_label.configure(image=photo)
+    
+    def prepare_next_frame(self):
+        """Convert the next cached frame into a PhotoImage between ticks."""
+        if self.frame_cache is None or self.current_word_index >= len(self.word_list):
+            return
+        self.next_frame = (self.current_word_index, self.build_frame(self.current_word_index))
+    
+    def on_display_configure(self, event):
+        """Remember the display size and re-center the word shown."""
+        self.display_size = (event.width, event.height)
+        if self.displayed_word is not None and self.word_labels[1].winfo_exists():
+            self.place_word_labels()
+    
     def update_word_display(self, before, center, after):
         """Update the word display with colored center letter."""
-        # Clear any existing word widgets
-        for widget in self.text_display_frame.winfo_children():
-            widget.destroy()
-        
-        # Create labels for each part with monospace font
-        font = ctk.CTkFont(family="Courier", size=32)
-        
-        # Get frame width to calculate center position
-        self.text_display_frame.update_idletasks()
-        frame_center_x = self.text_display_frame.winfo_width() / 2
-        
-        # With monospace font, estimate character width (roughly 0.6 * font size)
-        char_width = 19  # Approximate for Courier size 32
-        
-        # Calculate pixel positions
-        # Center letter should be at frame_center_x
-        center_label = ctk.CTkLabel(
-            self.text_display_frame, 
-            text=center, 
-            font=font, 
-            fg_color="white", 
-            text_color="red"
-        )
-        center_label.place(x=frame_center_x, y=50, anchor="center")
-        
-        # Before text ends just before center letter
-        if before:
-            before_width = len(before) * char_width
-            before_label = ctk.CTkLabel(
-                self.text_display_frame, 
-                text=before, 
-                font=font, 
-                fg_color="white", 
-                text_color="black"
-            )
-            before_label.place(x=frame_center_x - char_width/2, y=50, anchor="e")
-        
-        # After text starts just after center letter
-        if after:
-            after_label = ctk.CTkLabel(
-                self.text_display_frame, 
-                text=after, 
-                font=font, 
-                fg_color="white", 
-                text_color="black"
+        if self.word_labels is None or not self.word_labels[1].winfo_exists():
+            # Clear any other widgets and create the labels once
+            for widget in self.text_display_frame.winfo_children():
+                widget.destroy()
+            self.word_labels = tuple(
+                tk.Label(
+                    self.text_display_frame,
+                    font=self.word_font,
+                    bg="white",
+                    fg=color,
+                    padx=0,
+                    pady=0,
+                    borderwidth=0,
+                    highlightthickness=0
+                )
+                for color in ("black", "red", "black")
             )
-            after_label.place(x=frame_center_x + char_width/2, y=50, anchor="w")
+        
+        for label, text in zip(self.word_labels, (before, center, after)):
+            label.configure(text=text)
+        self.displayed_word = (before, center, after)
+        self.place_word_labels()
+    
+    def place_word_labels(self):
+        """Position the word labels so the center letter sits in the middle of the display."""
+        width, height = self.display_size
+        center_left, center_right = self.font_metrics.center_bounds(width / 2, self.displayed_word[1])
+        before_label, center_label, after_label = self.word_labels
+        
+        # Before text ends at the center letter, after text starts where it ends
+        before_label.place(x=round(center_left), y=height // 2, anchor="e")
+        center_label.place(x=round(center_left), y=height // 2, anchor="w")
+        after_label.place(x=round(center_right), y=height // 2, anchor="w")
+    
+    def jump_to(self, index):
+        """Move playback to a word index."""
+        self.current_word_index = max(0, min(index, len(self.word_list)))
+        if self.frame_cache is not None:
+            self.frame_cache.seek(self.current_word_index)
+            self.next_frame = None
+        
+        # While paused, show the word playback will resume from
+        if not self.is_reading and self.current_word_index < len(self.word_list):
+            self.update_word_display(*split_word(self.word_list[self.current_word_index]))
+    
+    def reading_position(self):
+        """Return the index of the word the reader is at."""
+        if self.is_reading:
+            # The index has already moved past the word on screen
+            return max(self.current_word_index - 1, 0)
+        return self.current_word_index
+    
+    def previous_sentence(self):
+        """Go back to the start of the current or previous sentence."""
+        if self.text_index is not None:
+            self.jump_to(self.text_index.previous_sentence(self.reading_position()))
+    
+    def next_sentence(self):
+        """Skip forward to the start of the next sentence."""
+        if self.text_index is not None:
+            self.jump_to(self.text_index.next_sentence(self.reading_position()))
+    
+    def previous_paragraph(self):
+        """Go back to the start of the current or previous paragraph."""
+        if self.text_index is not None:
+            self.jump_to(self.text_index.previous_paragraph(self.reading_position()))
+    
+    def next_paragraph(self):
+        """Skip forward to the start of the next paragraph."""
+        if self.text_index is not None:
+            self.jump_to(self.text_index.next_paragraph(self.reading_position()))
     
     def stop_reading(self):
         """Stop the speed reading session."""
         self.is_reading = False
+        if self.frame_cache is not None:
+            self.frame_cache.stop()
+            self.frame_cache = None
+            self.next_frame = None
         self.start_button.configure(state="normal")
         self.stop_button.configure(state="disabled")
         print("Reading stopped")
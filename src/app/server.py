@@ -0,0 +1,469 @@
+"""
+Server module for SpeedRead.
+Runs a shared playback clock without the GUI and broadcasts each word to
+browser clients over WebSocket, for group reading sessions.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import struct
+import time
+from .frame_renderer import split_word
+
+
+# Key suffix defined by RFC 6455 for the opening handshake
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OPCODE_TEXT = 0x1
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+# Clients only ever send control frames, so anything larger is rejected
+MAX_CLIENT_PAYLOAD = 64 * 1024
+
+CLIENT_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>SpeedRead</title>
+<style>
+  body { font-family: "Courier New", monospace; text-align: center; margin-top: 20vh; }
+  #word { font-size: 48px; white-space: pre; }
+  #center { color: red; }
+  #status { color: gray; margin-top: 2em; }
+</style>
+</head>
+<body>
+<div id="word"><span id="before"></span><span id="center"></span><span id="after"></span></div>
+<div id="status">Connecting...</div>
+<script>
+  const socket = new WebSocket(`ws://${location.host}/ws`);
+  const status = document.getElementById("status");
+  socket.onmessage = (message) => {
+    const event = JSON.parse(message.data);
+    if (event.type === "tick") {
+      // Pad the shorter side so the center letter stays in place
+      const before = event.word.slice(0, event.orp);
+      const after = event.word.slice(event.orp + 1);
+      const width = Math.max(before.length, after.length);
+      document.getElementById("before").textContent = before.padStart(width);
+      document.getElementById("center").textContent = event.word[event.orp];
+      document.getElementById("after").textContent = after.padEnd(width);
+      status.textContent = `${event.position + 1} / ${event.total}`;
+    } else if (event.type === "end") {
+      status.textContent = "Finished";
+    }
+  };
+  socket.onclose = () => { status.textContent = "Disconnected"; };
+</script>
+</body>
+</html>
+"""
+
+
+def websocket_accept_key(key: str) -> str:
+    """
+    Compute the Sec-WebSocket-Accept value for a handshake key.
+
+    Args:
+        key: Value of the client's Sec-WebSocket-Key header
+
+    Returns:
+        Base64 encoded accept key
+    """
+    digest = hashlib.sha1((key + WEBSOCKET_GUID).encode('ascii')).digest()
+    return base64.b64encode(digest).decode('ascii')
+
+
+def encode_frame(payload: bytes, opcode: int = OPCODE_TEXT, mask: bool = False) -> bytes:
+    """
+    Encode a single unfragmented WebSocket frame.
+
+    Args:
+        payload: Frame payload
+        opcode: Frame opcode
+        mask: Mask the payload, as required for frames sent by a client
+
+    Returns:
+        Encoded frame
+    """
+    length = len(payload)
+    mask_bit = 0x80 if mask else 0
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, mask_bit | length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, mask_bit | 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, mask_bit | 127, length)
+
+    if not mask:
+        return header + payload
+    mask_key = os.urandom(4)
+    return header + mask_key + _apply_mask(payload, mask_key)
+
+
+def _apply_mask(payload: bytes, mask_key: bytes) -> bytes:
+    """XOR a payload with a repeating 4-byte mask."""
+    repeated = (mask_key * (len(payload) // 4 + 1))[:len(payload)]
+    return (int.from_bytes(payload, 'big') ^ int.from_bytes(repeated, 'big')).to_bytes(len(payload), 'big')
+
+
+async def read_frame(reader: asyncio.StreamReader, max_payload: int = MAX_CLIENT_PAYLOAD) -> Tuple[int, bytes]:
+    """
+    Read a single WebSocket frame.
+
+    Args:
+        reader: Stream to read from
+        max_payload: Largest payload accepted
+
+    Returns:
+        Tuple of (opcode, unmasked payload)
+
+    Raises:
+        ConnectionError: If the frame is larger than max_payload
+        asyncio.IncompleteReadError: If the connection closes mid-frame
+    """
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        length, = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        length, = struct.unpack("!Q", await reader.readexactly(8))
+    if length > max_payload:
+        raise ConnectionError("WebSocket frame too large")
+
+    mask_key = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask_key is not None:
+        payload = _apply_mask(payload, mask_key)
+    return first & 0x0F, payload
+
+
+async def read_http_request(reader: asyncio.StreamReader) -> Tuple[str, Dict[str, str]]:
+    """
+    Read an HTTP request line and its headers.
+
+    Args:
+        reader: Stream to read from
+
+    Returns:
+        Tuple of (request path, headers with lowercase names)
+    """
+    data = await reader.readuntil(b"\r\n\r\n")
+    lines = data.decode('latin-1').split("\r\n")
+    parts = lines[0].split()
+    if len(parts) != 3:
+        raise ConnectionError("Malformed HTTP request")
+
+    headers = {}
+    for line in lines[1:]:
+        name, separator, value = line.partition(":")
+        if separator:
+            headers[name.strip().lower()] = value.strip()
+    return parts[1], headers
+
+
+class ClientConnection:
+    """
+    A connected WebSocket client with a bounded queue of outgoing frames.
+
+    When a client reads slower than words are broadcast its queue fills up
+    and the oldest frames are dropped, so a slow client skips ahead to the
+    current word instead of falling further behind or holding up the others.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, queue_size: int = 64):
+        self.writer = writer
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def offer(self, frame: bytes):
+        """Queue a frame, dropping the oldest one if the queue is full."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(frame)
+
+    async def send_loop(self):
+        """Write queued frames to the socket until the connection closes."""
+        while True:
+            frame = await self.queue.get()
+            self.writer.write(frame)
+            await self.writer.drain()
+
+
+class ReadingServer:
+    """
+    HTTP and WebSocket server that plays a word list on a shared clock.
+
+    GET / serves a client page and /ws upgrades to a WebSocket that receives
+    one JSON event per word:
+    {"type": "tick", "word", "orp", "position", "total", "time"}, where orp is
+    the index of the highlighted letter and time is the wall clock time the
+    word was sent. An {"type": "end"} event follows the last word.
+
+    By default playback starts when the first client connects; clients that
+    join later pick up at the current word.
+    """
+
+    def __init__(self, words: Sequence[str], wpm: int = 300, host: str = "127.0.0.1",
+                 port: int = 8765, client_queue_size: int = 64, start_on_connect: bool = True):
+        if wpm < 1:
+            raise ValueError("Speed must be at least 1 WPM")
+        self.words = words
+        self.wpm = wpm
+        self.host = host
+        self.port = port
+        self.client_queue_size = client_queue_size
+        self.start_on_connect = start_on_connect
+
+        self.clients: List[ClientConnection] = []
+        self.position = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._clock_task: Optional[asyncio.Task] = None
+        self._playing = asyncio.Event()
+
+    async def start(self):
+        """Start listening, and start the playback clock unless it waits for a client."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        # Port 0 picks a free port, report the one actually bound
+        self.port = self._server.sockets[0].getsockname()[1]
+        if not self.start_on_connect:
+            self.play()
+
+    def play(self):
+        """Start the playback clock if it is not running yet."""
+        if self._clock_task is None:
+            self._clock_task = asyncio.create_task(self._playback_loop())
+            self._playing.set()
+
+    async def stop(self):
+        """Stop the clock, disconnect all clients and stop listening."""
+        if self._clock_task is not None:
+            self._clock_task.cancel()
+        for client in list(self.clients):
+            client.writer.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def wait_finished(self):
+        """Wait until playback has started and every word has been broadcast."""
+        await self._playing.wait()
+        await asyncio.shield(self._clock_task)
+
+    def broadcast(self, event: dict):
+        """Queue an event for every connected client."""
+        # Encoded once and shared, so the cost per client is a queue put
+        frame = encode_frame(json.dumps(event).encode('utf-8'))
+        for client in self.clients:
+            client.offer(frame)
+
+    async def _playback_loop(self):
+        """Broadcast one word per tick until the end of the word list."""
+        loop = asyncio.get_running_loop()
+        interval = 60 / self.wpm
+        # Each tick is scheduled from the start time, so late wakeups don't add up
+        start = loop.time()
+        total = len(self.words)
+
+        for position in range(total):
+            delay = start + position * interval - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            word = self.words[position]
+            self.position = position
+            self.broadcast({
+                "type": "tick",
+                "word": word,
+                "orp": len(split_word(word)[0]),
+                "position": position,
+                "total": total,
+                "time": time.time(),
+            })
+
+        self.position = total
+        self.broadcast({"type": "end", "total": total})
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve the client page or upgrade the connection to a WebSocket."""
+        try:
+            path, headers = await read_http_request(reader)
+            if path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                await self._serve_websocket(reader, writer, headers)
+            elif path == "/":
+                self._write_response(writer, "200 OK", "text/html; charset=utf-8", CLIENT_PAGE.encode('utf-8'))
+            else:
+                self._write_response(writer, "404 Not Found", "text/plain", b"Not found")
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            writer.close()
+
+    def _write_response(self, writer: asyncio.StreamWriter, status: str, content_type: str, body: bytes):
+        """Write a complete HTTP response."""
+        writer.write(
+            f"HTTP/1.1 {status}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode('latin-1') + body
+        )
+
+    async def _serve_websocket(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                               headers: Dict[str, str]):
+        """Complete the handshake, then feed the client until it disconnects."""
+        key = headers.get("sec-websocket-key")
+        if key is None:
+            self._write_response(writer, "400 Bad Request", "text/plain", b"Missing Sec-WebSocket-Key")
+            return
+
+        writer.write(
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {websocket_accept_key(key)}\r\n\r\n".encode('latin-1')
+        )
+        await writer.drain()
+
+        client = ClientConnection(writer, self.client_queue_size)
+        client.offer(encode_frame(json.dumps({
+            "type": "hello",
+            "wpm": self.wpm,
+            "position": self.position,
+            "total": len(self.words),
+        }).encode('utf-8')))
+        self.clients.append(client)
+        send_task = asyncio.create_task(client.send_loop())
+        if self.start_on_connect:
+            self.play()
+
+        try:
+            # Clients only send control frames, answer pings until they close
+            while not send_task.done():
+                opcode, payload = await read_frame(reader)
+                if opcode == OPCODE_CLOSE:
+                    writer.write(encode_frame(payload[:2], OPCODE_CLOSE))
+                    break
+                if opcode == OPCODE_PING:
+                    client.offer(encode_frame(payload, OPCODE_PONG))
+        finally:
+            self.clients.remove(client)
+            send_task.cancel()
+
+
+async def _client_session(host: str, port: int, duration: float,
+                          latencies: List[float]) -> Tuple[int, bool]:
+    """Connect one WebSocket client and collect tick latencies until the end or the deadline."""
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode('ascii')
+    writer.write(
+        f"GET /ws HTTP/1.1\r\nHost: {host}:{port}\r\n"
+        "Upgrade: websocket\r\nConnection: Upgrade\r\n"
+        f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode('latin-1')
+    )
+    await writer.drain()
+
+    ticks = 0
+    finished = False
+    try:
+        response = await reader.readuntil(b"\r\n\r\n")
+        if b" 101 " not in response.split(b"\r\n", 1)[0]:
+            raise ConnectionError("WebSocket handshake failed")
+
+        deadline = asyncio.get_running_loop().time() + duration
+        while True:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                opcode, payload = await asyncio.wait_for(read_frame(reader, max_payload=1 << 20), remaining)
+            except asyncio.TimeoutError:
+                break
+            if opcode != OPCODE_TEXT:
+                continue
+            event = json.loads(payload)
+            if event["type"] == "tick":
+                latencies.append(time.time() - event["time"])
+                ticks += 1
+            elif event["type"] == "end":
+                finished = True
+                break
+
+        writer.write(encode_frame(struct.pack("!H", 1000), OPCODE_CLOSE, mask=True))
+        await writer.drain()
+    finally:
+        writer.close()
+    return ticks, finished
+
+
+async def run_load_test(host: str, port: int, clients: int = 100, duration: float = 10.0) -> dict:
+    """
+    Connect many WebSocket clients to a running server and measure delivery.
+
+    Args:
+        host: Server host
+        port: Server port
+        clients: Number of concurrent clients
+        duration: Longest time to stay connected, in seconds
+
+    Returns:
+        Dictionary with the number of clients that connected, failed and
+        saw the end of the session, ticks received and latency statistics
+        in milliseconds
+    """
+    latencies: List[float] = []
+    results = await asyncio.gather(
+        *(_client_session(host, port, duration, latencies) for _ in range(clients)),
+        return_exceptions=True,
+    )
+    completed = [result for result in results if not isinstance(result, BaseException)]
+
+    latencies.sort()
+    return {
+        "clients": len(completed),
+        "failed": clients - len(completed),
+        "finished": sum(1 for _, finished in completed if finished),
+        "ticks": sum(ticks for ticks, _ in completed),
+        "mean_latency_ms": 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+        "p99_latency_ms": 1000 * latencies[int(len(latencies) * 0.99)] if latencies else 0.0,
+    }
+
+
+def run_server(words: Sequence[str], wpm: int = 300, host: str = "127.0.0.1",
+               port: int = 8765) -> Optional[int]:
+    """
+    Serve a reading session until every word has been played or Ctrl+C is pressed.
+
+    Args:
+        words: Words to play
+        wpm: Reading speed in words per minute
+        host: Interface to listen on
+        port: Port to listen on
+
+    Returns:
+        Number of words played, or None if the speed is invalid
+    """
+    if wpm < 1:
+        print("Speed must be at least 1 WPM")
+        return None
+
+    async def serve():
+        server = ReadingServer(words, wpm, host, port)
+        await server.start()
+        print(f"Serving {len(words)} words at {wpm} WPM on http://{host}:{server.port}/")
+        print("Playback starts when the first reader connects")
+        try:
+            await server.wait_finished()
+            # Give clients a moment to receive the end event
+            await asyncio.sleep(1.0)
+        finally:
+            await server.stop()
+        return server.position
+
+    return asyncio.run(serve())
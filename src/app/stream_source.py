@@ -0,0 +1,185 @@
+"""
+Streaming source module for SpeedRead.
+Reads words from stdin, pipes or files that are still being written, so
+playback can start before the input is complete.
+"""
+
+from typing import BinaryIO, Iterator, List, Optional, Union
+import codecs
+import os
+import queue
+import sys
+import threading
+import time
+from .text_extractor import StreamingCleaner
+
+
+# Number of words a consumer keeps ahead of its playback position
+STREAM_LOOKAHEAD_WORDS = 8192
+
+
+class StreamSource:
+    """
+    Reads a byte stream on a background thread and cleans its words into a
+    bounded queue.
+
+    When the queue is full the reader stops reading, so a fast writer on the
+    other end of a pipe is blocked by the operating system instead of the
+    words piling up in memory.
+    """
+
+    def __init__(self, stream: Union[BinaryIO, str], citation_style: str = "none", follow: bool = False,
+                 max_buffered_words: int = 4096, chunk_size: int = 4096, poll_interval: float = 0.25):
+        # A path is opened on the reader thread, opening a named pipe blocks until a writer connects
+        self.stream = stream
+        self.follow = follow
+        self.chunk_size = chunk_size
+        self.poll_interval = poll_interval
+
+        self._cleaner = StreamingCleaner(citation_style)
+        self._words = queue.Queue(maxsize=max_buffered_words)
+        self._stop_event = threading.Event()
+        self._done = threading.Event()
+        self._thread = None
+
+    @property
+    def finished(self) -> bool:
+        """True once the input has ended and every word has been taken."""
+        return self._done.is_set() and self._words.empty()
+
+    def start(self):
+        """Start reading on a background thread."""
+        self._thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop reading and close the stream."""
+        self._stop_event.set()
+        if not isinstance(self.stream, str) and self.stream is not sys.stdin.buffer:
+            try:
+                self.stream.close()
+            except Exception:
+                pass
+
+    def read_available(self, limit: int = 256) -> List[str]:
+        """
+        Take the words that have arrived so far without blocking.
+
+        Args:
+            limit: Maximum number of words to take
+
+        Returns:
+            List of words, possibly empty
+        """
+        words = []
+        while len(words) < limit:
+            try:
+                words.append(self._words.get_nowait())
+            except queue.Empty:
+                break
+        return words
+
+    def read_ahead(self, buffered: int, lookahead: int = STREAM_LOOKAHEAD_WORDS,
+                   limit: int = 256) -> List[str]:
+        """
+        Take arrived words only while the consumer is short of words ahead.
+
+        Leaving words in the queue lets it fill up, which pauses the reader
+        thread, so a paused reader holds at most lookahead words plus the queue.
+
+        Args:
+            buffered: Number of words the consumer holds ahead of its playback position
+            lookahead: Number of words to keep ahead of the playback position
+            limit: Maximum number of words to take
+
+        Returns:
+            List of words, empty while enough words are buffered
+        """
+        if buffered >= lookahead:
+            return []
+        return self.read_available(min(limit, lookahead - buffered))
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield words as they arrive until the input ends."""
+        while not self.finished:
+            try:
+                yield self._words.get(timeout=self.poll_interval)
+            except queue.Empty:
+                continue
+
+    def _put(self, words: List[str]) -> bool:
+        """Queue words, waiting for room. Returns False if stopped meanwhile."""
+        for word in words:
+            while True:
+                if self._stop_event.is_set():
+                    return False
+                try:
+                    self._words.put(word, timeout=self.poll_interval)
+                    break
+                except queue.Full:
+                    continue
+        return True
+
+    def _read_loop(self):
+        """Read, decode and tokenize chunks until the input ends or stop() is called."""
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        partial = ""
+        opened = isinstance(self.stream, str)
+
+        try:
+            if opened:
+                self.stream = open(self.stream, 'rb')
+            fd = self.stream.fileno()
+            while not self._stop_event.is_set():
+                data = os.read(fd, self.chunk_size)
+                if not data:
+                    if self.follow:
+                        # Wait for the file to grow, like tail -f
+                        time.sleep(self.poll_interval)
+                        continue
+                    break
+
+                text = partial + decoder.decode(data)
+                tokens = text.split()
+                # A token touching the end of the chunk may continue in the next one
+                if tokens and not text[-1].isspace():
+                    partial = tokens.pop()
+                else:
+                    partial = ""
+                if not self._put(self._cleaner.feed(tokens)):
+                    return
+
+            text = partial + decoder.decode(b'', final=True)
+            self._put(self._cleaner.feed(text.split()) + self._cleaner.close())
+
+        except Exception as e:
+            if not self._stop_event.is_set():
+                print(f"Error reading stream: {e}")
+        finally:
+            if opened and not isinstance(self.stream, str):
+                self.stream.close()
+            self._done.set()
+
+
+def open_stream_source(path: str, citation_style: str = "none", follow: bool = False,
+                       max_buffered_words: int = 4096) -> Optional[StreamSource]:
+    """
+    Open a streaming source and start reading it.
+
+    Args:
+        path: Path to a file or named pipe, or "-" for stdin
+        citation_style: Citation style filter ("none", "notes", "parenthesis", "numeric")
+        follow: Keep waiting for new data at the end of the file
+        max_buffered_words: Maximum number of words held before reading pauses
+
+    Returns:
+        The started source, or None if the path does not exist
+    """
+    if path != "-" and not os.path.exists(path):
+        print(f"Error: File not found: {path}")
+        return None
+
+    stream = sys.stdin.buffer if path == "-" else path
+    source = StreamSource(stream, citation_style, follow, max_buffered_words)
+    source.start()
+    return source
@@ -1,17 +1,160 @@
 """
 Text extraction module for SpeedRead.
-Handles extraction of text from various file formats (PDF, Word, TXT).
+Handles extraction of text from various file formats (PDF, Word, TXT, HTML, Markdown).
 """
 
-from typing import Optional, List
+from typing import Callable, Iterable, Iterator, MutableSequence, Optional, List, Sequence, Tuple
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
 import os
-import fitz  # PyMuPDF
+import re
 import string
+from .text_index import TextIndex, find_sentence_starts
+from .extractor_registry import find_extractor, get_file_extension
+
+# PyMuPDF is imported on first use, see _require_fitz
+fitz = None
+
+
+# Blank lines separate paragraphs
+PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
+
+def _require_fitz():
+    """Import PyMuPDF the first time a PDF is opened."""
+    global fitz
+    if fitz is None:
+        import fitz as pymupdf
+        fitz = pymupdf
+    return fitz
+
+
+# Word count from which clean_word_list_parallel and clean_paragraphs use a process pool
+PARALLEL_CLEAN_MIN_WORDS = 500000
+
+# Number of raw tokens clean_paragraphs sends to a worker process at a time
+PARALLEL_BATCH_WORDS = 65536
+
+# Size of the pieces HTML, Markdown and text files are read in
+READ_CHUNK_SIZE = 64 * 1024
+
+# Number of raw tokens after which paragraph readers split a paragraph
+MAX_PARAGRAPH_TOKENS = 4096
+
+# HTML elements whose content is not read
+HTML_SKIPPED_TAGS = {
+    "script", "style", "nav", "code", "pre", "noscript", "template", "svg", "iframe", "title"
+}
+
+# HTML elements that start or end a paragraph
+HTML_BLOCK_TAGS = {
+    "p", "div", "section", "article", "main", "header", "footer", "aside", "blockquote",
+    "h1", "h2", "h3", "h4", "h5", "h6", "li", "ul", "ol", "dl", "dt", "dd",
+    "table", "tr", "td", "th", "figure", "figcaption", "hr", "body"
+}
+
+# Markdown line patterns
+MARKDOWN_FENCE = re.compile(r'^\s{0,3}(```|~~~)')
+MARKDOWN_HEADING = re.compile(r'^\s{0,3}#{1,6}(\s+|$)')
+MARKDOWN_BLOCK_PREFIX = re.compile(r'^\s{0,3}(?:>\s?|[-*+]\s+|\d+[.)]\s+)+')
+MARKDOWN_RULE = re.compile(r'^\s{0,3}(?:[-*_=]\s*){3,}$')
+MARKDOWN_REFERENCE = re.compile(r'^\s{0,3}\[[^\]]+\]:\s')
+MARKDOWN_INDENTED = re.compile(r'^(?: {4}|\t)')
+MARKDOWN_LIST_ITEM = re.compile(r'^\s{0,3}(?:[-*+]|\d+[.)])\s+')
+
+# Markdown inline patterns and their replacements, applied in order
+MARKDOWN_INLINE = [
+    (re.compile(r'`[^`]*`'), ' '),  # Inline code
+    (re.compile(r'!\[[^\]]*\]\([^)]*\)'), ' '),  # Images
+    (re.compile(r'\[([^\]]*)\]\([^)]*\)'), r'\1'),  # Links keep their text
+    (re.compile(r'\[([^\]]*)\]\[[^\]]*\]'), r'\1'),  # Reference links
+    (re.compile(r'<[^>]+>'), ' '),  # Inline HTML
+    (re.compile(r'(?<!\w)(?:\*\*|__|\*|_|~~)(?=\S)|(?<=\S)(?:\*\*|__|\*|_|~~)(?!\w)'), ''),  # Emphasis
+    (re.compile(r'\|'), ' '),  # Table cells
+]
+
+# Citations removed by each citation style. Parenthesis and numeric citations
+# are bracketed groups of at most MAX_CITATION_TOKENS tokens.
+MAX_CITATION_TOKENS = 16
+CITATION_OPENERS = "(["
+CITATION_CLOSERS = ")]"
+CITATION_GROUPS = {
+    # Author-year citations: (Smith, 2020), (see Smith et al. 2019a; Lee 2020, p. 4)
+    "parenthesis": ("(", re.compile(
+        r'\((?:see |cf\. |e\.g\.,? )?[A-Z][^()]*?[ ,](?:1[5-9]|20)\d\d[a-z]?\b[^()]*\)')),
+    # Numbered citations: [3], [3, 4], [1-3]
+    "numeric": ("[", re.compile(r'\[\s*\d+[a-z]?(?:\s*[,;\u2013\u2014-]\s*\d+[a-z]?)*\s*\]')),
+}
+# Note markers: superscript numbers, or digits right after a word's punctuation as in "end.12"
+NOTE_MARKER = re.compile(r'[\u00b9\u00b2\u00b3\u2070\u2074-\u2079]+|(?<=[^\W\d_][.,;:!?"\u201d\u2019])\d{1,3}$')
+
+
+def remove_citations(words: List[str], citation_style: str = "none") -> List[str]:
+    """
+    Remove the citations of a citation style from raw tokens.
+    
+    Punctuation following a removed citation is kept on the word before it,
+    so "claim (Smith, 2020)." becomes "claim.".
+    
+    Args:
+        words: Raw tokens
+        citation_style: Citation style filter ("none", "notes", "parenthesis", "numeric")
+        
+    Returns:
+        Tokens without citations
+    """
+    if citation_style == "notes":
+        return [NOTE_MARKER.sub('', word) for word in words]
+    if citation_style not in CITATION_GROUPS:
+        return words
+    
+    opener, pattern = CITATION_GROUPS[citation_style]
+    words = list(words)
+    filtered = []
+    i = 0
+    while i < len(words):
+        word = words[i]
+        start = word.find(opener)
+        if start < 0:
+            filtered.append(word)
+            i += 1
+            continue
+        
+        # Join tokens until the group closes, a citation never spans more than MAX_CITATION_TOKENS
+        text = word
+        end = i
+        limit = min(len(words), i + MAX_CITATION_TOKENS)
+        while not any(c in text[start:] for c in CITATION_CLOSERS) and end + 1 < limit:
+            end += 1
+            text += ' ' + words[end]
+        
+        match = pattern.match(text, start)
+        if match is None:
+            filtered.append(word)
+            i += 1
+            continue
+        
+        prefix, suffix = text[:start], text[match.end():]
+        if prefix:
+            # Look for further citations in what is left of the token
+            words[end] = prefix + suffix
+            i = end
+        elif suffix and all(c in string.punctuation for c in suffix) and filtered:
+            filtered[-1] += suffix
+            i = end + 1
+        elif suffix:
+            words[end] = suffix
+            i = end
+        else:
+            i = end + 1
+    return filtered
 
 
 def clean_word_list(words: List[str], citation_style: str = "none") -> List[str]:
     """
-    Clean the word list by removing parentheses and commas, and combining hyphenated words.
+    Clean the word list by removing citations, parentheses and commas, and combining hyphenated words.
     
     Args:
         words: List of words to clean
@@ -20,6 +163,9 @@ def clean_word_list(words: List[str], citation_style: str = "none") -> List[str]
     Returns:
         Cleaned list of words
     """
+    if citation_style != "none":
+        words = remove_citations(words, citation_style)
+    
     cleaned_words = []
     
     for word in words:
@@ -67,6 +213,445 @@ def clean_word_list(words: List[str], citation_style: str = "none") -> List[str]
     return cleaned_words
 
 
+def ends_with_hyphen(tokens: List[str]) -> Optional[bool]:
+    """
+    Check whether the last word clean_word_list would emit for tokens ends with '-'.
+    
+    Args:
+        tokens: Raw tokens
+        
+    Returns:
+        True or False, or None if the tokens produce no words at all
+    """
+    for token in reversed(tokens):
+        if all(c in string.punctuation for c in token):
+            continue
+        pieces = token.replace('(', ' ').replace(')', ' ').replace(',', ' ').split()
+        if pieces:
+            return pieces[-1].endswith('-')
+    return None
+
+
+def has_open_bracket(tokens: Sequence[str]) -> bool:
+    """
+    Check whether a bracket opened in tokens is still open after them.
+    
+    Args:
+        tokens: Raw tokens
+        
+    Returns:
+        True if a '(' or '[' is not closed within tokens
+    """
+    depth = 0
+    for token in reversed(tokens):
+        for c in reversed(token):
+            if c in CITATION_CLOSERS:
+                depth += 1
+            elif c in CITATION_OPENERS:
+                if depth == 0:
+                    return True
+                depth -= 1
+    return False
+
+
+def can_split_after(tokens: Sequence[str]) -> bool:
+    """
+    Check whether the words of tokens can be cleaned apart from any tokens that follow.
+    
+    That is the case when the last word does not end with '-' and no
+    bracket is still open or closes after that word's start, since removing
+    a citation there could expose a hyphenated word before it.
+    
+    Args:
+        tokens: Raw tokens before a possible split
+        
+    Returns:
+        True if no hyphen join or citation can cross a split after tokens
+    """
+    for token in reversed(tokens):
+        if any(c in token for c in CITATION_CLOSERS):
+            return False
+        if all(c in string.punctuation for c in token):
+            continue
+        pieces = token.replace('(', ' ').replace(')', ' ').replace(',', ' ').split()
+        if pieces:
+            if pieces[-1].endswith('-'):
+                return False
+            break
+    return not has_open_bracket(tokens[-MAX_CITATION_TOKENS:])
+
+
+def is_safe_split(tokens: Sequence[str], index: int) -> bool:
+    """
+    Check whether tokens can be cleaned separately before and after an index.
+    
+    Splitting is safe when the token before the split is a word that does
+    not end with '-', so no hyphen join can cross it, and no citation of up
+    to MAX_CITATION_TOKENS tokens can cross it or touch it (see can_split_after).
+    
+    Args:
+        tokens: Raw tokens
+        index: Index of the first token after the split, between 1 and len(tokens) - 1
+        
+    Returns:
+        True if cleaning both sides separately gives the same words as cleaning them together
+    """
+    if ends_with_hyphen([tokens[index - 1]]) is not False:
+        return False
+    if tokens[index].startswith(tuple(CITATION_OPENERS)):
+        return False
+    return can_split_after(tokens[max(index - MAX_CITATION_TOKENS, 0):index])
+
+
+def split_long_paragraph(tokens: List[str], max_tokens: int = MAX_PARAGRAPH_TOKENS) -> int:
+    """
+    Find where to split a paragraph that has grown past max_tokens.
+    
+    The split goes after the last sentence end within the first max_tokens
+    tokens if there is one, otherwise after the last safe split there.
+    
+    Args:
+        tokens: Raw tokens of the paragraph read so far
+        max_tokens: Maximum number of tokens per paragraph
+        
+    Returns:
+        Number of tokens to yield as a paragraph, 0 if it should not be split
+    """
+    if len(tokens) <= max_tokens:
+        return 0
+    split = 0
+    for i in range(max_tokens - 1, -1, -1):
+        if is_safe_split(tokens, i + 1):
+            if tokens[i].rstrip("\"')]}").endswith(('.', '!', '?')):
+                return i + 1
+            split = split or i + 1
+    return split
+
+
+class StreamingCleaner:
+    """Incremental clean_word_list for tokens that arrive in pieces."""
+    
+    def __init__(self, citation_style: str = "none"):
+        self.citation_style = citation_style
+        self._pending = []
+    
+    def feed(self, tokens: List[str]) -> List[str]:
+        """
+        Clean newly arrived tokens.
+        
+        Tokens that may still be joined with a later hyphenated word or
+        citation are held back until more input arrives or the stream is closed.
+        
+        Args:
+            tokens: Raw tokens in arrival order
+            
+        Returns:
+            Cleaned words that are final
+        """
+        self._pending.extend(tokens)
+        if self.citation_style in CITATION_GROUPS:
+            # The last token waits for the next one, which may start a citation
+            split = len(self._pending) - 1
+            while split > 0 and not is_safe_split(self._pending, split):
+                split -= 1
+        else:
+            split = len(self._pending)
+            while split > 0 and ends_with_hyphen([self._pending[split - 1]]) is not False:
+                split -= 1
+        
+        if split <= 0:
+            # Nothing but punctuation produces no words and can be dropped
+            if ends_with_hyphen(self._pending) is None:
+                self._pending = []
+            return []
+        
+        ready = self._pending[:split]
+        del self._pending[:split]
+        return clean_word_list(ready, self.citation_style)
+    
+    def close(self) -> List[str]:
+        """
+        Clean the held back tokens at the end of the stream.
+        
+        Returns:
+            Remaining cleaned words
+        """
+        remaining = clean_word_list(self._pending, self.citation_style)
+        self._pending = []
+        return remaining
+
+
+def find_chunk_bounds(words: List[str], chunk_count: int) -> List[Tuple[int, int]]:
+    """
+    Split a token list into chunks that can be cleaned independently.
+    
+    Each split is moved forward from its even position to the next safe split
+    (see is_safe_split), so no hyphen join or citation crosses a chunk boundary.
+    
+    Args:
+        words: Raw tokens
+        chunk_count: Number of chunks to aim for
+        
+    Returns:
+        List of (start, end) index pairs covering all tokens in order
+    """
+    bounds = []
+    start = 0
+    for chunk in range(1, chunk_count):
+        split = max(len(words) * chunk // chunk_count, start + 1)
+        while split < len(words) and not is_safe_split(words, split):
+            split += 1
+        if split >= len(words):
+            break
+        bounds.append((start, split))
+        start = split
+    bounds.append((start, len(words)))
+    return bounds
+
+
+def _clean_chunk(data: bytes, citation_style: str) -> bytes:
+    """Clean a newline-joined, UTF-8 encoded chunk of tokens in a worker process."""
+    words = data.decode('utf-8').split('\n') if data else []
+    return '\n'.join(clean_word_list(words, citation_style)).encode('utf-8')
+
+
+def _clean_groups(data: bytes, sizes: array, citation_style: str) -> Tuple[bytes, array, array]:
+    """
+    Clean a batch of paragraph groups in a worker process.
+    
+    Args:
+        data: Newline-joined, UTF-8 encoded tokens of all groups
+        sizes: Number of tokens in each group
+        citation_style: Citation style filter
+        
+    Returns:
+        Tuple of the newline-joined cleaned words, the number of cleaned words
+        of each group and the sentence starts relative to the batch
+    """
+    tokens = data.decode('utf-8').split('\n') if data else []
+    cleaned_words = []
+    counts = array('L')
+    sentence_starts = array('L')
+    start = 0
+    for size in sizes:
+        cleaned = clean_word_list(tokens[start:start + size], citation_style)
+        start += size
+        sentence_starts.extend(len(cleaned_words) + i for i in find_sentence_starts(cleaned))
+        counts.append(len(cleaned))
+        cleaned_words.extend(cleaned)
+    return '\n'.join(cleaned_words).encode('utf-8'), counts, sentence_starts
+
+
+def clean_word_list_parallel(words: List[str], citation_style: str = "none",
+                             workers: Optional[int] = None,
+                             min_words: int = PARALLEL_CLEAN_MIN_WORDS) -> List[str]:
+    """
+    Clean a large word list in chunks on a process pool.
+    
+    Every chunk is sent to its worker as one encoded buffer rather than a list
+    of strings, and chunk boundaries never split a hyphen join, so the result
+    is identical to clean_word_list.
+    
+    Args:
+        words: List of words to clean (must not contain newlines)
+        citation_style: Citation style filter ("none", "notes", "parenthesis", "numeric")
+        workers: Number of worker processes, the CPU count by default
+        min_words: Below this many words the list is cleaned serially
+        
+    Returns:
+        Cleaned list of words
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers < 2 or len(words) < min_words:
+        return clean_word_list(words, citation_style)
+    
+    # A few chunks per worker evens out chunks that clean slower than others
+    chunks = []
+    for start, end in find_chunk_bounds(words, workers * 4):
+        data = '\n'.join(words[start:end]).encode('utf-8')
+        if data.count(b'\n') != end - start - 1:
+            # A token contains a newline and would be split apart
+            return clean_word_list(words, citation_style)
+        chunks.append(data)
+    
+    cleaned_words = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for result in executor.map(_clean_chunk, chunks, [citation_style] * len(chunks)):
+            if result:
+                cleaned_words.extend(result.decode('utf-8').split('\n'))
+    return cleaned_words
+
+
+def split_paragraphs(text: str) -> List[List[str]]:
+    """
+    Split text into paragraphs of raw tokens at blank lines.
+    
+    Args:
+        text: Text to split
+        
+    Returns:
+        List of paragraphs, each a list of tokens
+    """
+    return [block.split() for block in PARAGRAPH_BREAK.split(text) if block.strip()]
+
+
+def find_paragraph_split(paragraphs: Sequence[List[str]], start: int, min_tokens: int) -> int:
+    """
+    Find where to end a slice of paragraphs that can be cleaned on its own.
+    
+    Cleaning paragraphs[start:end] and paragraphs[end:] separately gives the
+    same words and index as cleaning them together (see is_safe_split).
+    
+    Args:
+        paragraphs: Paragraphs, each a list of raw tokens
+        start: Index of the first paragraph of the slice
+        min_tokens: Number of tokens the slice should hold at least
+        
+    Returns:
+        Index of the first paragraph after the slice, len(paragraphs) if the slice takes the rest
+    """
+    count = 0
+    end = start
+    while end < len(paragraphs):
+        count += len(paragraphs[end])
+        end += 1
+        if count < min_tokens or end == len(paragraphs) or not paragraphs[end]:
+            continue
+        # The tokens around the boundary decide whether it is safe
+        before = []
+        previous = end
+        while previous > 0 and len(before) < MAX_CITATION_TOKENS:
+            previous -= 1
+            before[:0] = paragraphs[previous][-MAX_CITATION_TOKENS:]
+        if before and is_safe_split(before + paragraphs[end][:1], len(before)):
+            return end
+    return len(paragraphs)
+
+
+def clean_paragraphs(paragraphs: Iterable[List[str]], citation_style: str = "none",
+                     words: Optional[MutableSequence[str]] = None,
+                     first_source: int = 0, workers: Optional[int] = None,
+                     min_words: int = PARALLEL_CLEAN_MIN_WORDS) -> Tuple[MutableSequence[str], TextIndex]:
+    """
+    Clean paragraphs of raw tokens and index their sentence and paragraph boundaries.
+    
+    The result is identical to running clean_word_list over all tokens. A word
+    hyphenated across a paragraph or page break keeps both halves in one paragraph.
+    
+    Paragraphs are cleaned serially until min_words tokens have been read.
+    The rest of a larger document is sent to a process pool in batches, with
+    only a few batches in flight so memory use stays bounded.
+    
+    Args:
+        paragraphs: Paragraphs, each a list of raw tokens, consumed one at a time
+        citation_style: Citation style filter ("none", "notes", "parenthesis", "numeric")
+        words: Sequence to append the cleaned words to, a new list by default
+        first_source: Raw paragraph number of the first paragraph, when cleaning
+            a slice of a document's paragraphs
+        workers: Number of worker processes, the CPU count by default; 1 cleans serially
+        min_words: Number of tokens after which the process pool is used
+        
+    Returns:
+        Tuple of the cleaned words and their boundary index
+    """
+    if words is None:
+        words = []
+    workers = workers or os.cpu_count() or 1
+    paragraph_starts = array('L')
+    paragraph_sources = array('L')
+    sentence_starts = array('L')
+    group = []
+    group_source = first_source
+    
+    token_count = 0
+    executor = None
+    batch = []  # (group, source) pairs waiting to be sent to the pool
+    batch_tokens = 0
+    pending = deque()  # (future, sources) of batches in flight, in document order
+    
+    def record(cleaned, source, relative_sentence_starts):
+        if cleaned:
+            start = len(words)
+            paragraph_starts.append(start)
+            paragraph_sources.append(source)
+            sentence_starts.extend(start + i for i in relative_sentence_starts)
+            words.extend(cleaned)
+    
+    def collect(future, sources):
+        data, counts, batch_sentence_starts = future.result()
+        cleaned_words = data.decode('utf-8').split('\n') if data else []
+        start = 0
+        sentence = 0
+        for source, count in zip(sources, counts):
+            # Sentence starts of this group, shifted to the group's first word
+            group_sentences = []
+            while sentence < len(batch_sentence_starts) and batch_sentence_starts[sentence] < start + count:
+                group_sentences.append(batch_sentence_starts[sentence] - start)
+                sentence += 1
+            record(cleaned_words[start:start + count], source, group_sentences)
+            start += count
+    
+    def submit_batch():
+        nonlocal batch, batch_tokens
+        tokens = [token for group, _ in batch for token in group]
+        data = '\n'.join(tokens).encode('utf-8')
+        if data.count(b'\n') != max(len(tokens) - 1, 0):
+            # A token contains a newline and would be split apart, clean in order here
+            while pending:
+                collect(*pending.popleft())
+            for group, source in batch:
+                cleaned = clean_word_list(group, citation_style)
+                record(cleaned, source, find_sentence_starts(cleaned))
+        else:
+            sizes = array('L', (len(group) for group, _ in batch))
+            future = executor.submit(_clean_groups, data, sizes, citation_style)
+            pending.append((future, [source for _, source in batch]))
+            while len(pending) > workers * 2:
+                collect(*pending.popleft())
+        batch = []
+        batch_tokens = 0
+    
+    def flush(group, source):
+        nonlocal executor, token_count, batch_tokens
+        token_count += len(group)
+        if executor is None:
+            if workers < 2 or token_count < min_words:
+                cleaned = clean_word_list(group, citation_style)
+                record(cleaned, source, find_sentence_starts(cleaned))
+                return
+            executor = ProcessPoolExecutor(max_workers=workers)
+        batch.append((group, source))
+        batch_tokens += len(group)
+        if batch_tokens >= PARALLEL_BATCH_WORDS:
+            submit_batch()
+    
+    try:
+        for source, tokens in enumerate(paragraphs, start=first_source):
+            if not tokens:
+                continue
+            # Only break where no hyphen join or citation can cross the boundary
+            if group and not tokens[0].startswith(tuple(CITATION_OPENERS)) and can_split_after(group):
+                flush(group, group_source)
+                group = []
+            if not group:
+                group_source = source
+            group.extend(tokens)
+        flush(group, group_source)
+        
+        if batch:
+            submit_batch()
+        while pending:
+            collect(*pending.popleft())
+    finally:
+        if executor is not None:
+            # Drop batches not started yet, e.g. after an error (cancel_futures needs Python 3.9)
+            for future, _ in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+    
+    return words, TextIndex(sentence_starts, paragraph_starts, len(words), paragraph_sources)
+
+
 def extract_text_from_pdf(file_path: str, citation_style: str = "none") -> Optional[List[str]]:
     """
     Extract all text from a PDF file using PyMuPDF.
@@ -80,7 +665,7 @@ def extract_text_from_pdf(file_path: str, citation_style: str = "none") -> Optio
     """
     try:        
         # Open the PDF
-        doc = fitz.open(file_path)
+        doc = _require_fitz().open(file_path)
         text_parts = []
         
         # Extract text from each page
@@ -103,7 +688,7 @@ def extract_text_from_pdf(file_path: str, citation_style: str = "none") -> Optio
         words = full_text.split()
         
         # Clean the word list
-        words = clean_word_list(words, citation_style)
+        words = clean_word_list_parallel(words, citation_style)
         
         print(f"\n{'='*60}")
         print(f"PDF TEXT EXTRACTION: {os.path.basename(file_path)}")
@@ -140,7 +725,7 @@ def extract_text_from_txt(file_path: str, citation_style: str = "none") -> Optio
         words = text.split()
         
         # Clean the word list
-        words = clean_word_list(words, citation_style)
+        words = clean_word_list_parallel(words, citation_style)
         
         print(f"\n{'='*60}")
         print(f"TEXT FILE LOADED: {os.path.basename(file_path)}")
@@ -174,9 +759,440 @@ def extract_text_from_word(file_path: str, citation_style: str = "none") -> Opti
     return None
 
 
+class HTMLWordParser(HTMLParser):
+    """
+    Collects the words of an HTML document paragraph by paragraph, without
+    building a document tree. Completed paragraphs are collected in
+    `paragraphs` for the caller to take after each fed chunk.
+    """
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.paragraphs = []
+        self._tokens = []
+        self._partial = ""  # Text touching the end of the last data, may continue in the next
+        self._skip_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in HTML_SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in HTML_BLOCK_TAGS:
+            self.end_paragraph()
+        elif tag == "br":
+            self._end_word()
+    
+    def handle_endtag(self, tag):
+        if tag in HTML_SKIPPED_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+        elif tag in HTML_BLOCK_TAGS:
+            self.end_paragraph()
+    
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        text = self._partial + data
+        tokens = text.split()
+        if tokens and not text[-1].isspace():
+            self._partial = tokens.pop()
+        else:
+            self._partial = ""
+        self._tokens.extend(tokens)
+        
+        # Split text without block tags so a paragraph never grows without bound
+        split = split_long_paragraph(self._tokens)
+        while split:
+            self.paragraphs.append(self._tokens[:split])
+            del self._tokens[:split]
+            split = split_long_paragraph(self._tokens)
+    
+    def end_paragraph(self):
+        """Finish the current paragraph."""
+        self._end_word()
+        if self._tokens:
+            self.paragraphs.append(self._tokens)
+            self._tokens = []
+    
+    def _end_word(self):
+        """Finish a word that was waiting for more text."""
+        if self._partial:
+            self._tokens.append(self._partial)
+            self._partial = ""
+
+
+def iter_html_paragraphs(file_path: str) -> Iterator[List[str]]:
+    """
+    Read the raw tokens of an HTML file paragraph by paragraph.
+    
+    The file is fed to the parser in chunks, so memory use does not grow with
+    the size of the page. Script, style, navigation and code blocks are skipped.
+    Paragraphs longer than MAX_PARAGRAPH_TOKENS are split.
+    
+    Args:
+        file_path: Path to the HTML file
+        
+    Yields:
+        Paragraphs, each a list of raw tokens
+    """
+    parser = HTMLWordParser()
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        while True:
+            chunk = f.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            yield from parser.paragraphs
+            parser.paragraphs = []
+    
+    parser.close()
+    parser.end_paragraph()
+    yield from parser.paragraphs
+
+
+def strip_markdown(line: str) -> str:
+    """
+    Remove Markdown syntax from a line of text.
+    
+    Args:
+        line: Line of Markdown
+        
+    Returns:
+        The line's readable text
+    """
+    line = MARKDOWN_HEADING.sub('', line)
+    line = MARKDOWN_BLOCK_PREFIX.sub('', line)
+    for pattern, replacement in MARKDOWN_INLINE:
+        line = pattern.sub(replacement, line)
+    return line
+
+
+def iter_markdown_paragraphs(file_path: str) -> Iterator[List[str]]:
+    """
+    Read the raw tokens of a Markdown file paragraph by paragraph.
+    
+    The file is processed line by line. Front matter, code blocks, rules and
+    link reference definitions are skipped, headings become their own paragraph.
+    Indented lines inside a list are read as the list's text, not as code.
+    Paragraphs longer than MAX_PARAGRAPH_TOKENS are split.
+    
+    Args:
+        file_path: Path to the Markdown file
+        
+    Yields:
+        Paragraphs, each a list of raw tokens
+    """
+    tokens = []
+    in_fence = None  # Fence marker of the open code block
+    in_front_matter = False
+    after_blank = True
+    in_indented_code = False
+    in_list = False
+    
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        for line_number, line in enumerate(f):
+            line = line.rstrip('\n')
+            
+            if line_number == 0 and line.strip() == "---":
+                in_front_matter = True
+                continue
+            if in_front_matter:
+                in_front_matter = line.strip() not in ("---", "...")
+                continue
+            
+            fence = MARKDOWN_FENCE.match(line)
+            if in_fence:
+                if fence and fence.group(1) == in_fence:
+                    in_fence = None
+                continue
+            if fence:
+                in_fence = fence.group(1)
+                continue
+            
+            if not line.strip():
+                if tokens:
+                    yield tokens
+                    tokens = []
+                after_blank = True
+                continue
+            
+            indented = MARKDOWN_INDENTED.match(line) is not None
+            if in_list and indented:
+                # Continuation paragraphs and nested items of a list are text, not code
+                line = line.lstrip()
+            elif indented and (after_blank or in_indented_code) and not tokens:
+                # Indented code starts after a blank line and runs until an unindented line
+                in_indented_code = True
+                continue
+            elif MARKDOWN_LIST_ITEM.match(line):
+                in_list = True
+            elif after_blank:
+                in_list = False
+            in_indented_code = False
+            after_blank = False
+            
+            if MARKDOWN_RULE.match(line) or MARKDOWN_REFERENCE.match(line):
+                continue
+            
+            if MARKDOWN_HEADING.match(line):
+                if tokens:
+                    yield tokens
+                heading = strip_markdown(line).split()
+                if heading:
+                    yield heading
+                tokens = []
+                continue
+            
+            tokens.extend(strip_markdown(line).split())
+            split = split_long_paragraph(tokens)
+            while split:
+                yield tokens[:split]
+                tokens = tokens[split:]
+                split = split_long_paragraph(tokens)
+    
+    if tokens:
+        yield tokens
+
+
+def clean_paragraph_stream(paragraphs: Iterator[List[str]], citation_style: str = "none") -> List[str]:
+    """
+    Clean paragraphs of raw tokens as they are produced.
+    
+    Args:
+        paragraphs: Iterator of paragraphs, each a list of raw tokens
+        citation_style: Citation style filter ("none", "notes", "parenthesis", "numeric")
+        
+    Returns:
+        Cleaned list of words
+    """
+    cleaner = StreamingCleaner(citation_style)
+    words = []
+    for tokens in paragraphs:
+        words.extend(cleaner.feed(tokens))
+    words.extend(cleaner.close())
+    return words
+
+
+def extract_text_from_html(file_path: str, citation_style: str = "none") -> Optional[List[str]]:
+    """
+    Extract the readable text of an HTML file.
+    
+    Args:
+        file_path: Path to the HTML file
+        citation_style: Citation style filter ("none", "notes", "parenthesis", "numeric")
+        
+    Returns:
+        List of words, or None if extraction fails
+    """
+    try:
+        words = clean_paragraph_stream(iter_html_paragraphs(file_path), citation_style)
+        
+        print(f"\n{'='*60}")
+        print(f"HTML FILE LOADED: {os.path.basename(file_path)}")
+        print(f"Total words: {len(words)}")
+        print(f"{'='*60}\n")
+        
+        return words
+        
+    except Exception as e:
+        print(f"Error extracting text from HTML: {e}")
+        return None
+
+
+def extract_text_from_markdown(file_path: str, citation_style: str = "none") -> Optional[List[str]]:
+    """
+    Extract the readable text of a Markdown file.
+    
+    Args:
+        file_path: Path to the Markdown file
+        citation_style: Citation style filter ("none", "notes", "parenthesis", "numeric")
+        
+    Returns:
+        List of words, or None if extraction fails
+    """
+    try:
+        words = clean_paragraph_stream(iter_markdown_paragraphs(file_path), citation_style)
+        
+        print(f"\n{'='*60}")
+        print(f"MARKDOWN FILE LOADED: {os.path.basename(file_path)}")
+        print(f"Total words: {len(words)}")
+        print(f"{'='*60}\n")
+        
+        return words
+        
+    except Exception as e:
+        print(f"Error extracting text from Markdown: {e}")
+        return None
+
+
+def iter_pdf_paragraphs(file_path: str) -> Iterator[List[str]]:
+    """
+    Read the raw tokens of a PDF file page by page, grouped into paragraphs.
+    
+    Every page starts a new paragraph.
+    
+    Args:
+        file_path: Path to the PDF file
+        
+    Yields:
+        Paragraphs, each a list of raw tokens
+    """
+    doc = _require_fitz().open(file_path)
+    try:
+        for page_num in range(len(doc)):
+            yield from split_paragraphs(doc[page_num].get_text())
+    finally:
+        doc.close()
+
+
+def iter_txt_paragraphs(file_path: str) -> Iterator[List[str]]:
+    """
+    Read the raw tokens of a plain text file in chunks, grouped into paragraphs.
+    
+    Blank lines separate paragraphs. Paragraphs longer than MAX_PARAGRAPH_TOKENS
+    are split, so memory use stays bounded even without line breaks.
+    
+    Args:
+        file_path: Path to the text file
+        
+    Yields:
+        Paragraphs, each a list of raw tokens
+    """
+    tokens = []
+    line = ""  # Start of a line continuing in the next chunk
+    line_has_text = False  # Part of the current line was already tokenized
+    with open(file_path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(READ_CHUNK_SIZE)
+            lines = (line + chunk).split('\n')
+            # The last line is complete only at the end of the file
+            line = lines.pop() if chunk else ""
+            
+            for text in lines:
+                if text.strip():
+                    tokens.extend(text.split())
+                elif tokens and not line_has_text:
+                    yield tokens
+                    tokens = []
+                line_has_text = False
+            
+            if len(line) > READ_CHUNK_SIZE:
+                # A very long line, tokenize all but a word that may continue
+                pieces = line.split()
+                line = pieces.pop() if pieces and not line[-1].isspace() else ""
+                tokens.extend(pieces)
+                line_has_text = line_has_text or bool(pieces)
+            
+            split = split_long_paragraph(tokens)
+            while split:
+                yield tokens[:split]
+                tokens = tokens[split:]
+                split = split_long_paragraph(tokens)
+            
+            if not chunk:
+                break
+    if tokens:
+        yield tokens
+
+
+def get_paragraph_reader(file_path: str) -> Optional[Callable[[str], Iterator[List[str]]]]:
+    """
+    Find the paragraph reader for a file based on its content and extension.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        Generator function reading the file's paragraphs, or None if the type is unsupported
+    """
+    spec = find_extractor(file_path)
+    return spec.paragraph_reader() if spec is not None else None
+
+
+def extract_paragraphs(file_path: str) -> Optional[List[List[str]]]:
+    """
+    Read the raw tokens of a file, grouped into paragraphs, based on its extension.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        List of paragraphs, each a list of raw tokens, or None if extraction fails
+    """
+    if not os.path.exists(file_path):
+        print(f"Error: File not found: {file_path}")
+        return None
+    
+    reader = get_paragraph_reader(file_path)
+    if reader is None:
+        print(f"Unsupported file type: {get_file_extension(file_path)}")
+        return None
+    
+    try:
+        return list(reader(file_path))
+        
+    except Exception as e:
+        print(f"Error extracting text from {os.path.basename(file_path)}: {e}")
+        return None
+
+
+def extract_document(file_path: str, citation_style: str = "none",
+                     words: Optional[MutableSequence[str]] = None,
+                     raw_paragraphs: Optional[List[List[str]]] = None) -> Optional[Tuple[MutableSequence[str], TextIndex]]:
+    """
+    Extract the cleaned words of a file together with their sentence and paragraph index.
+    
+    Paragraphs are cleaned as they are read. When a disk-backed sequence is
+    passed as words, memory use stays bounded for large files. Large
+    documents of backends marked parallel are cleaned on a process pool.
+    
+    Args:
+        file_path: Path to the file
+        citation_style: Citation style filter ("none", "notes", "parenthesis", "numeric")
+        words: Sequence to append the cleaned words to, a new list by default
+        raw_paragraphs: List to append the raw tokens of each paragraph to, so
+            the document can be cleaned again with another citation style
+        
+    Returns:
+        Tuple of the words and their boundary index, or None if extraction fails
+    """
+    if not os.path.exists(file_path):
+        print(f"Error: File not found: {file_path}")
+        return None
+    
+    spec = find_extractor(file_path)
+    reader = spec.paragraph_reader() if spec is not None else None
+    if reader is None:
+        print(f"Unsupported file type: {get_file_extension(file_path)}")
+        return None
+    # Backends not marked parallel are cleaned in this process only
+    workers = None if spec.parallel else 1
+    
+    def keep_raw(paragraphs):
+        for tokens in paragraphs:
+            raw_paragraphs.append(tokens)
+            yield tokens
+    
+    paragraphs = reader(file_path)
+    if raw_paragraphs is not None:
+        paragraphs = keep_raw(paragraphs)
+    try:
+        words, text_index = clean_paragraphs(paragraphs, citation_style, words, workers=workers)
+    except Exception as e:
+        print(f"Error extracting text from {os.path.basename(file_path)}: {e}")
+        return None
+    
+    print(f"\n{'='*60}")
+    print(f"DOCUMENT LOADED: {os.path.basename(file_path)}")
+    print(f"Total words: {len(words)}")
+    print(f"Total sentences: {len(text_index.sentence_starts)}")
+    print(f"Total paragraphs: {len(text_index.paragraph_starts)}")
+    print(f"{'='*60}\n")
+    
+    return words, text_index
+
+
 def extract_text(file_path: str, citation_style: str = "none") -> Optional[List[str]]:
     """
-    Extract text from a file based on its extension.
+    Extract text from a file with the backend matching its content and extension.
     
     Args:
         file_path: Path to the file
@@ -189,14 +1205,9 @@ def extract_text(file_path: str, citation_style: str = "none") -> Optional[List[
         print(f"Error: File not found: {file_path}")
         return None
     
-    file_extension = file_path.lower().split('.')[-1]
-    
-    if file_extension == 'pdf':
-        return extract_text_from_pdf(file_path, citation_style)
-    elif file_extension == 'txt':
-        return extract_text_from_txt(file_path, citation_style)
-    elif file_extension in ['doc', 'docx']:
-        return extract_text_from_word(file_path, citation_style)
-    else:
-        print(f"Unsupported file type: {file_extension}")
+    spec = find_extractor(file_path)
+    if spec is None:
+        print(f"Unsupported file type: {get_file_extension(file_path)}")
         return None
+    
+    return spec.extract_function()(file_path, citation_style)
@@ -0,0 +1,121 @@
+"""
+Text index module for SpeedRead.
+Records sentence and paragraph boundaries of a word list so playback can
+jump between them without rescanning the words.
+"""
+
+from typing import Iterable, Sequence
+from array import array
+from bisect import bisect_left, bisect_right
+import re
+
+
+# A word ends a sentence if it ends in . ! or ? (optionally followed by closing quotes)
+SENTENCE_END = re.compile(r'[.!?]["\'’”»]*$')
+
+# Abbreviations that end in a period without ending the sentence
+ABBREVIATIONS = {"mr.", "mrs.", "ms.", "dr.", "prof.", "st.", "vs.", "e.g.", "i.e.", "cf.", "fig.", "no.", "al."}
+
+
+def ends_sentence(word: str) -> bool:
+    """
+    Check whether a word ends a sentence.
+
+    Args:
+        word: Cleaned word
+
+    Returns:
+        True if the next word starts a new sentence
+    """
+    return SENTENCE_END.search(word) is not None and word.lower() not in ABBREVIATIONS
+
+
+def find_sentence_starts(words: Sequence[str], paragraph_starts: Iterable[int] = ()) -> array:
+    """
+    Find the index of the first word of every sentence.
+
+    Args:
+        words: Cleaned word list
+        paragraph_starts: Sorted paragraph start indices; every paragraph also starts a sentence
+
+    Returns:
+        Sorted array of sentence start indices
+    """
+    starts = array('L')
+    paragraphs = iter(paragraph_starts)
+    next_paragraph = next(paragraphs, None)
+    at_start = True
+
+    for i, word in enumerate(words):
+        if i == next_paragraph:
+            at_start = True
+            next_paragraph = next(paragraphs, None)
+        if at_start:
+            starts.append(i)
+        at_start = ends_sentence(word)
+
+    return starts
+
+
+class TextIndex:
+    """
+    Sentence and paragraph start offsets for a word list.
+
+    paragraph_sources optionally records, for every paragraph, the index of
+    the raw paragraph it was cleaned from.
+    """
+
+    def __init__(self, sentence_starts: Iterable[int] = (), paragraph_starts: Iterable[int] = (),
+                 word_count: int = 0, paragraph_sources: Iterable[int] = ()):
+        self.sentence_starts = array('L', sentence_starts)
+        self.paragraph_starts = array('L', paragraph_starts)
+        self.paragraph_sources = array('L', paragraph_sources)
+        self.word_count = word_count
+
+    def join(self, other: "TextIndex") -> "TextIndex":
+        """
+        Combine with the index of the words that follow this index's words.
+
+        Args:
+            other: Index of the following words
+
+        Returns:
+            Index over both word lists
+        """
+        offset = self.word_count
+        return TextIndex(
+            self.sentence_starts + array('L', (start + offset for start in other.sentence_starts)),
+            self.paragraph_starts + array('L', (start + offset for start in other.paragraph_starts)),
+            self.word_count + other.word_count,
+            self.paragraph_sources + other.paragraph_sources
+        )
+
+    def paragraph_of(self, index: int) -> int:
+        """Return the number of the paragraph containing the word at index."""
+        return max(bisect_right(self.paragraph_starts, index) - 1, 0)
+
+    def previous_sentence(self, index: int) -> int:
+        """Return the start of the sentence before the word at index (its own sentence if mid-sentence)."""
+        return self._previous(self.sentence_starts, index)
+
+    def next_sentence(self, index: int) -> int:
+        """Return the start of the sentence after the word at index."""
+        return self._next(self.sentence_starts, index)
+
+    def previous_paragraph(self, index: int) -> int:
+        """Return the start of the paragraph before the word at index (its own paragraph if mid-paragraph)."""
+        return self._previous(self.paragraph_starts, index)
+
+    def next_paragraph(self, index: int) -> int:
+        """Return the start of the paragraph after the word at index."""
+        return self._next(self.paragraph_starts, index)
+
+    def _previous(self, starts: array, index: int) -> int:
+        """Return the last start strictly before index, or 0."""
+        position = bisect_left(starts, index)
+        return starts[position - 1] if position > 0 else 0
+
+    def _next(self, starts: array, index: int) -> int:
+        """Return the first start strictly after index, or the word count."""
+        position = bisect_right(starts, index)
+        return starts[position] if position < len(starts) else self.word_count
@@ -0,0 +1,168 @@
+"""
+Word buffer module for SpeedRead.
+Holds a word list on disk and keeps only a window of it around the reading
+position in memory, for documents too large to load whole.
+"""
+
+from typing import Iterable, Iterator, List, Optional
+from array import array
+import tempfile
+import threading
+
+
+class WordBuffer:
+    """
+    Sequence of words stored in fixed-size segments in a spill file.
+
+    Only the segments around the last accessed index (and the words not yet
+    written out) are kept in memory. A background thread loads the segments
+    ahead of the reading position, so sequential playback does not wait on
+    disk reads. Supports len(), indexing and extend() like a list.
+    """
+
+    def __init__(self, segment_size: int = 4096, segments_behind: int = 2,
+                 segments_ahead: int = 4, spill_dir: Optional[str] = None):
+        self.segment_size = segment_size
+        self.segments_behind = segments_behind
+        self.segments_ahead = segments_ahead
+
+        self._spill_file = tempfile.TemporaryFile(dir=spill_dir)
+        self._file_lock = threading.Lock()
+        self._offsets = array('Q', [0])  # Byte offset of each written segment, plus the end
+        self._tail = []  # Words of the segment that is still being filled
+        self._length = 0
+
+        self._segments = {}  # Segment number -> list of words, for loaded segments
+        self._current_segment = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._prefetch_loop, daemon=True)
+        self._thread.start()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("word index out of range")
+
+        segment, offset = divmod(index, self.segment_size)
+        with self._condition:
+            if segment != self._current_segment:
+                self._move_window(segment)
+            if segment == len(self._offsets) - 1:
+                return self._tail[offset]
+            words = self._segments.get(segment)
+
+        if words is None:
+            # Not prefetched (e.g. after a jump), read it now
+            words = self._read_segment(segment)
+            with self._condition:
+                if self._in_window(segment):
+                    self._segments[segment] = words
+        return words[offset]
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._length):
+            yield self[index]
+
+    @property
+    def resident_words(self) -> int:
+        """Number of words currently held in memory."""
+        with self._condition:
+            return len(self._tail) + sum(len(words) for words in self._segments.values())
+
+    def append(self, word: str):
+        """Append a single word."""
+        self.extend([word])
+
+    def extend(self, words: Iterable[str]):
+        """
+        Append words, writing every filled segment to the spill file.
+
+        Args:
+            words: Words to append; they must not contain newlines
+        """
+        with self._condition:
+            self._tail.extend(words)
+            while len(self._tail) >= self.segment_size:
+                segment_words = self._tail[:self.segment_size]
+                del self._tail[:self.segment_size]
+                self._write_segment(segment_words)
+            self._length = (len(self._offsets) - 1) * self.segment_size + len(self._tail)
+            self._condition.notify_all()
+
+    def close(self):
+        """Stop prefetching and delete the spill file."""
+        with self._condition:
+            self._closed = True
+            self._segments = {}
+            self._condition.notify_all()
+        self._thread.join(timeout=1.0)
+        with self._file_lock:
+            self._spill_file.close()
+
+    def _write_segment(self, words: List[str]):
+        """Write a full segment to the end of the spill file. Caller holds the condition."""
+        data = '\n'.join(words).encode('utf-8')
+        with self._file_lock:
+            self._spill_file.seek(self._offsets[-1])
+            self._spill_file.write(data)
+        segment = len(self._offsets) - 1
+        self._offsets.append(self._offsets[-1] + len(data))
+        if self._in_window(segment):
+            self._segments[segment] = words
+
+    def _read_segment(self, segment: int) -> List[str]:
+        """Read a written segment back from the spill file."""
+        start, end = self._offsets[segment], self._offsets[segment + 1]
+        with self._file_lock:
+            self._spill_file.seek(start)
+            data = self._spill_file.read(end - start)
+        return data.decode('utf-8').split('\n')
+
+    def _in_window(self, segment: int) -> bool:
+        """Check whether a segment belongs in memory. Caller holds the condition."""
+        return (self._current_segment - self.segments_behind
+                <= segment
+                <= self._current_segment + self.segments_ahead)
+
+    def _move_window(self, segment: int):
+        """Center the window on a segment and drop the rest. Caller holds the condition."""
+        self._current_segment = segment
+        for loaded in list(self._segments):
+            if not self._in_window(loaded):
+                del self._segments[loaded]
+        self._condition.notify_all()
+
+    def _next_missing(self) -> Optional[int]:
+        """Find the next segment to prefetch, nearest ahead first. Caller holds the condition."""
+        written = len(self._offsets) - 1
+        ahead = range(self._current_segment, self._current_segment + self.segments_ahead + 1)
+        behind = range(self._current_segment - 1, self._current_segment - self.segments_behind - 1, -1)
+        for segment in list(ahead) + list(behind):
+            if 0 <= segment < written and segment not in self._segments:
+                return segment
+        return None
+
+    def _prefetch_loop(self):
+        """Load missing segments of the window until closed."""
+        while True:
+            with self._condition:
+                segment = self._next_missing()
+                while not self._closed and segment is None:
+                    self._condition.wait()
+                    segment = self._next_missing()
+                if self._closed:
+                    return
+
+            try:
+                words = self._read_segment(segment)
+            except (OSError, ValueError):
+                return
+
+            with self._condition:
+                if self._in_window(segment):
+                    self._segments[segment] = words
@@ -0,0 +1,347 @@
+"""
+Word timing module for SpeedRead.
+Paces playback per word instead of uniformly: common short words are shown
+briefly and rare or long words longer, while the average speed stays at
+the chosen WPM. Word frequencies come from a compact hashed lexicon that is
+memory-mapped on first use.
+
+The bundled lexicon only ranks the few hundred most common English words,
+so its frequency term is a discount for those words: every other word gets
+the full rarity weight and is told apart by length alone. A lexicon built
+from a larger ranked list (up to 65535 words) grades rarer words as well.
+"""
+
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+from array import array
+import math
+import mmap
+import os
+import string
+import struct
+import sys
+import threading
+
+
+# Bundled lexicon and the word list it is built from
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "..", "assets")
+LEXICON_PATH = os.path.join(ASSETS_DIR, "word_frequency.bin")
+WORD_LIST_PATH = os.path.join(ASSETS_DIR, "common_words.txt")
+
+# Lexicon file layout: header, then a table of 32-bit word hashes, then a
+# table of 16-bit frequency ranks in the same slots. A zero hash marks an
+# empty slot. All values are little-endian.
+LEXICON_MAGIC = b"SRLX"
+LEXICON_VERSION = 1
+LEXICON_HEADER = struct.Struct("<4sHHII")  # magic, version, reserved, slot count, word count
+
+FNV_OFFSET_BASIS = 0x811C9DC5
+FNV_PRIME = 0x01000193
+
+# Characters stripped from a word before it is looked up
+WORD_PUNCTUATION = string.punctuation + "“”‘’«»—–…"
+
+# Relative weights making up a word's display time, before normalization
+BASE_WEIGHT = 0.8
+RARITY_WEIGHT = 0.35  # Added in full for words missing from the lexicon or ranked last
+LONG_WORD_LENGTH = 6
+LENGTH_WEIGHT = 0.04  # Per letter beyond LONG_WORD_LENGTH
+MAX_LENGTH_WEIGHT = 0.5
+SENTENCE_PAUSE = 0.6
+CLAUSE_PAUSE = 0.3
+
+# Number of words whose timings are computed together
+TIMING_CHUNK_SIZE = 4096
+
+
+def fnv1a_32(data: bytes) -> int:
+    """
+    Hash bytes with 32-bit FNV-1a.
+
+    Args:
+        data: Bytes to hash
+
+    Returns:
+        Hash value, never 0 so that 0 can mark empty table slots
+    """
+    value = FNV_OFFSET_BASIS
+    for byte in data:
+        value = ((value ^ byte) * FNV_PRIME) & 0xFFFFFFFF
+    return value or 1
+
+
+def normalize_word(word: str) -> str:
+    """Lowercase a word and strip surrounding punctuation for lookup."""
+    return word.strip(WORD_PUNCTUATION).lower()
+
+
+def build_lexicon(words: Iterable[str], output_path: str) -> int:
+    """
+    Write a lexicon file from words in order of decreasing frequency.
+
+    The table has at least twice as many slots as words, so linear probing
+    finds a word or an empty slot within a few steps.
+
+    Args:
+        words: Words, most frequent first; later duplicates are ignored
+        output_path: File to write
+
+    Returns:
+        Number of words written
+    """
+    ranks: Dict[int, int] = {}
+    for word in words:
+        key = normalize_word(word)
+        if key:
+            ranks.setdefault(fnv1a_32(key.encode('utf-8')), min(len(ranks) + 1, 0xFFFF))
+
+    slot_count = 1
+    while slot_count < 2 * len(ranks):
+        slot_count *= 2
+
+    hashes = array('I', [0]) * slot_count
+    slot_ranks = array('H', [0]) * slot_count
+    mask = slot_count - 1
+    for value, rank in ranks.items():
+        slot = value & mask
+        while hashes[slot]:
+            slot = (slot + 1) & mask
+        hashes[slot] = value
+        slot_ranks[slot] = rank
+
+    if sys.byteorder == 'big':
+        hashes.byteswap()
+        slot_ranks.byteswap()
+
+    with open(output_path, 'wb') as f:
+        f.write(LEXICON_HEADER.pack(LEXICON_MAGIC, LEXICON_VERSION, 0, slot_count, len(ranks)))
+        f.write(hashes.tobytes())
+        f.write(slot_ranks.tobytes())
+    return len(ranks)
+
+
+def build_default_lexicon(word_list_path: str = WORD_LIST_PATH) -> int:
+    """
+    Rebuild the bundled lexicon from a word list file.
+
+    Args:
+        word_list_path: File with one word per line, most frequent first;
+            lines starting with '#' are ignored. The bundled list by default.
+
+    Returns:
+        Number of words written
+    """
+    with open(word_list_path, 'r', encoding='utf-8') as f:
+        words = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    return build_lexicon(words, LEXICON_PATH)
+
+
+class Lexicon:
+    """
+    Read-only word frequency table backed by a memory-mapped lexicon file.
+
+    The file is opened on the first lookup, so creating a Lexicon costs
+    nothing at startup. Lookups hash the word and probe a few slots.
+    """
+
+    def __init__(self, path: str = LEXICON_PATH):
+        self.path = path
+        self.word_count = 0
+        self._hashes: Optional[Sequence[int]] = None
+        self._ranks: Optional[Sequence[int]] = None
+        self._mask = 0
+        self._lock = threading.Lock()
+
+    def rank(self, word: str) -> Optional[int]:
+        """
+        Look up the frequency rank of a word.
+
+        Args:
+            word: Word to look up, normalized with normalize_word
+
+        Returns:
+            1 for the most common word and larger for rarer ones, or None if
+            the word is not in the lexicon
+        """
+        if self._hashes is None:
+            self._load()
+        value = fnv1a_32(word.encode('utf-8'))
+        hashes = self._hashes
+        slot = value & self._mask
+        while hashes[slot]:
+            if hashes[slot] == value:
+                return self._ranks[slot]
+            slot = (slot + 1) & self._mask
+        return None
+
+    def __contains__(self, word: str) -> bool:
+        return self.rank(word) is not None
+
+    def _load(self):
+        """Map the lexicon file into memory."""
+        with self._lock:
+            if self._hashes is not None:
+                return
+            with open(self.path, 'rb') as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic, version, _, slot_count, word_count = LEXICON_HEADER.unpack_from(data)
+            if magic != LEXICON_MAGIC or version != LEXICON_VERSION:
+                raise ValueError(f"Not a SpeedRead lexicon: {self.path}")
+
+            start = LEXICON_HEADER.size
+            middle = start + 4 * slot_count
+            if sys.byteorder == 'little':
+                view = memoryview(data)
+                hashes = view[start:middle].cast('I')
+                ranks = view[middle:middle + 2 * slot_count].cast('H')
+            else:
+                hashes = array('I', data[start:middle])
+                ranks = array('H', data[middle:middle + 2 * slot_count])
+                hashes.byteswap()
+                ranks.byteswap()
+
+            self.word_count = word_count
+            self._mask = slot_count - 1
+            self._ranks = ranks
+            self._hashes = hashes
+
+
+_default_lexicon: Optional[Lexicon] = None
+
+
+def get_lexicon() -> Lexicon:
+    """Return the shared bundled lexicon."""
+    global _default_lexicon
+    if _default_lexicon is None:
+        _default_lexicon = Lexicon()
+    return _default_lexicon
+
+
+def word_weight(word: str, lexicon: Lexicon) -> float:
+    """
+    Compute a word's relative display time, before normalization.
+
+    Args:
+        word: Word as shown, including punctuation
+        lexicon: Word frequency table
+
+    Returns:
+        Weight around 1, higher for words that take longer to read
+    """
+    core = normalize_word(word)
+    weight = BASE_WEIGHT
+
+    rank = lexicon.rank(core) if core else 1
+    if rank is None:
+        weight += RARITY_WEIGHT
+    else:
+        weight += RARITY_WEIGHT * math.log(rank) / math.log(max(lexicon.word_count, 2))
+
+    weight += min(LENGTH_WEIGHT * max(len(core) - LONG_WORD_LENGTH, 0), MAX_LENGTH_WEIGHT)
+
+    ending = word.rstrip("\"')]}”’»")[-1:]
+    if not ending:
+        return weight
+    if ending in ".!?":
+        weight += SENTENCE_PAUSE
+    elif ending in ",;:—–":
+        weight += CLAUSE_PAUSE
+    return weight
+
+
+def word_weights(words: Sequence[str], lexicon: Optional[Lexicon] = None,
+                 normalize: bool = True) -> array:
+    """
+    Compute relative display times for a batch of words.
+
+    Each distinct word is weighed once, so the cost grows with the
+    vocabulary rather than the length of the text.
+
+    Args:
+        words: Words to time
+        lexicon: Word frequency table, the bundled one by default
+        normalize: Scale the weights to average exactly 1
+
+    Returns:
+        Float array with one weight per word
+    """
+    lexicon = lexicon or get_lexicon()
+    cache: Dict[str, float] = {}
+    weights = array('f')
+    for word in words:
+        weight = cache.get(word)
+        if weight is None:
+            weight = cache[word] = word_weight(word, lexicon)
+        weights.append(weight)
+
+    if normalize and weights:
+        scale = len(weights) / sum(weights)
+        weights = array('f', [weight * scale for weight in weights])
+    return weights
+
+
+class AdaptiveTimer:
+    """
+    Per-word display times for a word list, computed chunk by chunk as
+    playback reaches them.
+
+    Every chunk is normalized to an average weight of 1, so the reading
+    speed over any chunk, and so over the whole text, matches the chosen
+    WPM. The word list may grow, as it does while a stream is read: words
+    of the last, partly filled chunk are timed as they arrive against the
+    chunk's running average, and the chunk is normalized once it is full.
+    """
+
+    def __init__(self, words: Sequence[str], lexicon: Optional[Lexicon] = None,
+                 chunk_size: int = TIMING_CHUNK_SIZE):
+        self.words = words
+        self.lexicon = lexicon
+        self.chunk_size = chunk_size
+        self._chunks: Dict[int, array] = {}
+        # Raw and scaled weights of chunks that are still filling up
+        self._growing: Dict[int, Tuple[array, array]] = {}
+
+    def weight(self, index: int) -> float:
+        """Relative display time of the word at index."""
+        chunk, offset = divmod(index, self.chunk_size)
+        weights = self._chunks.get(chunk)
+        if weights is not None:
+            return weights[offset]
+
+        raw, scaled = self._growing.get(chunk) or (array('f'), array('f'))
+        if len(raw) <= offset:
+            # Time only the words added since the chunk was last used
+            start = chunk * self.chunk_size + len(raw)
+            end = min((chunk + 1) * self.chunk_size, len(self.words))
+            added = word_weights([self.words[i] for i in range(start, end)], self.lexicon, normalize=False)
+            raw.extend(added)
+
+            if len(raw) == self.chunk_size:
+                self._growing.pop(chunk, None)
+                scale = len(raw) / sum(raw)
+                weights = self._chunks[chunk] = array('f', [weight * scale for weight in raw])
+                return weights[offset]
+
+            if added:
+                scale = len(raw) / sum(raw)
+                scaled.extend(weight * scale for weight in added)
+                self._growing[chunk] = (raw, scaled)
+        return scaled[offset]
+
+    def delay_ms(self, index: int, wpm: int) -> int:
+        """
+        Display time of the word at index in milliseconds.
+
+        Args:
+            index: Word index
+            wpm: Average reading speed in words per minute
+
+        Returns:
+            Delay before the next word
+        """
+        return round(self.weight(index) * 60000 / wpm)
+
+
+if __name__ == "__main__":
+    word_list_path = sys.argv[1] if len(sys.argv) > 1 else WORD_LIST_PATH
+    print(f"Wrote {build_default_lexicon(word_list_path)} words to {os.path.normpath(LEXICON_PATH)}")
@@ -4,16 +4,92 @@ A modern speed reading application with a GUI built using CustomTkinter.
 """
 
 import sys
+import os
+import stat
+import argparse
+import multiprocessing
 from setproctitle import setproctitle
 from app import SpeedReadApp
+from app.stream_source import open_stream_source
+from app.text_extractor import extract_document, extract_text
 
 # Set the application name for macOS dock
 setproctitle('SpeedRead')
 
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(prog="speedread", description="Speed read documents word by word.")
+    parser.add_argument("path", nargs="?", help="file or named pipe to open, or - to read from stdin")
+    parser.add_argument("-f", "--follow", action="store_true",
+                        help="keep reading as the file grows, like tail -f")
+    parser.add_argument("--export", metavar="OUTPUT",
+                        help="render the reading session to a .gif file or a directory of PNG frames instead of opening the app")
+    parser.add_argument("--serve", action="store_true",
+                        help="broadcast the reading session to browsers instead of opening the app")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on with --serve (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on with --serve (default: 8765)")
+    parser.add_argument("--wpm", type=int, default=300, help="reading speed for --export and --serve (default: 300)")
+    return parser.parse_args(argv)
+
+
+def is_stream(path, follow):
+    """Check whether a path should be read as a stream instead of loaded up front."""
+    if path == "-" or follow:
+        return True
+    try:
+        return stat.S_ISFIFO(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def export(args):
+    """Export the words of a file or stream without opening the GUI."""
+    # Imported here so that starting the app does not load the exporter
+    from app.exporter import export_reading_session
+
+    if is_stream(args.path, args.follow):
+        words = open_stream_source(args.path, follow=args.follow)
+    else:
+        document = extract_document(args.path)
+        words = document[0] if document is not None else None
+    if words is None:
+        return 1
+    return 0 if export_reading_session(words, args.wpm, args.export) is not None else 1
+
+
+def serve(args):
+    """Serve the words of a file to browser clients without opening the GUI."""
+    # Imported here so that starting the app does not load the server
+    from app.server import run_server
+
+    words = extract_text(args.path)
+    if not words:
+        return 1
+    return 0 if run_server(words, args.wpm, args.host, args.port) is not None else 1
+
+
 def main():
     """Main application entry point."""
     try:
+        args = parse_args()
+        if args.export:
+            if not args.path:
+                print("Error: --export needs a file to read", file=sys.stderr)
+                sys.exit(2)
+            sys.exit(export(args))
+        if args.serve:
+            if not args.path or is_stream(args.path, args.follow):
+                print("Error: --serve needs a file to read", file=sys.stderr)
+                sys.exit(2)
+            sys.exit(serve(args))
         app = SpeedReadApp()
+        if args.path and is_stream(args.path, args.follow):
+            source = open_stream_source(args.path, app.citation_style.get(), follow=args.follow)
+            if source is not None:
+                app.load_stream(source, "stdin" if args.path == "-" else os.path.basename(args.path))
+        elif args.path:
+            app.load_file(args.path)
         app.run()
     except KeyboardInterrupt:
         print("\nApplication terminated by user")
@@ -24,4 +100,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Worker processes of frozen builds must not start the app again
+    multiprocessing.freeze_support()
     main()
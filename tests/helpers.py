@@ -0,0 +1,15 @@
+"""
+Shared helpers for the SpeedRead unit tests.
+"""
+
+import time
+
+
+def wait_for(condition, timeout=2.0):
+    """Poll until condition() is true or the timeout expires."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
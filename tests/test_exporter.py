@@ -0,0 +1,126 @@
+"""
+Unit tests for the exporter module.
+"""
+
+import unittest
+import os
+import io
+import shutil
+import tempfile
+from PIL import Image
+
+try:
+    from src.app.exporter import split_gif, render_frames, export_reading_session
+except ImportError:
+    import sys
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from src.app.exporter import split_gif, render_frames, export_reading_session
+
+
+class TestSplitGif(unittest.TestCase):
+    """Test cases for the split_gif function."""
+
+    def test_split_single_frame(self):
+        """Test that the header and image block rebuild the original GIF."""
+        output = io.BytesIO()
+        Image.new("P", (4, 4)).save(output, format="GIF")
+        data = output.getvalue()
+
+        header, image_block = split_gif(data)
+
+        self.assertTrue(header.startswith(b"GIF8"))
+        self.assertTrue(image_block.startswith(b","))
+        self.assertEqual(data[-1:], b";")
+
+
+class TestRenderFrames(unittest.TestCase):
+    """Test cases for the render_frames function."""
+
+    def test_frames_in_word_order(self):
+        """Test that frames come back in order across batches."""
+        words = ["a", "bb", "ccc", "dddd", "eeeee"]
+        frames = list(render_frames(words, (120, 40), 16, "png", workers=1, batch_size=2))
+
+        self.assertEqual(len(frames), 5)
+        self.assertEqual(len(set(frames)), 5)
+        for frame in frames:
+            self.assertEqual(Image.open(io.BytesIO(frame)).size, (120, 40))
+
+
+class TestExportReadingSession(unittest.TestCase):
+    """Test cases for the export_reading_session function."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_export_gif(self):
+        """Test that a GIF has one frame per word and loops."""
+        path = os.path.join(self.temp_dir, "session.gif")
+        words = ["one", "two", "three", "four"]
+
+        frame_count = export_reading_session(words, 300, path, size=(120, 40), font_size=16, workers=1)
+
+        self.assertEqual(frame_count, 4)
+        with Image.open(path) as image:
+            self.assertEqual(image.n_frames, 4)
+            self.assertEqual(image.info["loop"], 0)
+            self.assertEqual(image.info["duration"], 200)
+
+    def test_gif_durations_keep_pace(self):
+        """Test that rounded frame delays add up to the exact session length."""
+        path = os.path.join(self.temp_dir, "session.gif")
+        words = ["word"] * 7
+
+        export_reading_session(words, 350, path, size=(80, 30), font_size=12, workers=1)
+
+        total = 0
+        with Image.open(path) as image:
+            for frame in range(image.n_frames):
+                image.seek(frame)
+                total += image.info["duration"]
+        # 7 words at 350 WPM take 1200 ms, though no single frame is a whole 10 ms step
+        self.assertEqual(total, 1200)
+
+    def test_export_png_sequence(self):
+        """Test that a directory path gets numbered PNG frames."""
+        output_dir = os.path.join(self.temp_dir, "frames")
+
+        frame_count = export_reading_session(iter(["alpha", "beta"]), 300, output_dir,
+                                             size=(120, 40), font_size=16, workers=1)
+
+        self.assertEqual(frame_count, 2)
+        self.assertEqual(sorted(os.listdir(output_dir)), ["frame_000001.png", "frame_000002.png"])
+        with Image.open(os.path.join(output_dir, "frame_000001.png")) as image:
+            self.assertEqual(image.size, (120, 40))
+
+    def test_export_no_words(self):
+        """Test that an empty session fails without leaving a file behind."""
+        path = os.path.join(self.temp_dir, "empty.gif")
+
+        self.assertIsNone(export_reading_session([], 300, path, workers=1))
+        self.assertFalse(os.path.exists(path))
+
+    def test_invalid_speed(self):
+        """Test that a speed below 1 WPM is rejected."""
+        path = os.path.join(self.temp_dir, "session.gif")
+        self.assertIsNone(export_reading_session(["word"], 0, path, workers=1))
+
+    def test_gif_speed_limit(self):
+        """Test that GIF speeds with frame delays below 20 ms are rejected, PNG frames are not."""
+        path = os.path.join(self.temp_dir, "session.gif")
+        self.assertIsNone(export_reading_session(["word"], 6500, path, workers=1))
+        self.assertFalse(os.path.exists(path))
+
+        self.assertEqual(export_reading_session(["one", "two"], 3000, path, size=(80, 30), font_size=12, workers=1), 2)
+        with Image.open(path) as image:
+            self.assertEqual(image.info["duration"], 20)
+
+        output_dir = os.path.join(self.temp_dir, "frames")
+        self.assertEqual(export_reading_session(["word"], 6500, output_dir, size=(80, 30), font_size=12, workers=1), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Unit tests for the extractor_registry module.
+"""
+
+import unittest
+import os
+import json
+import shutil
+import tempfile
+
+try:
+    from src.app import extractor_registry
+    from src.app.extractor_registry import (
+        ExtractorSpec, register_extractor, get_extractor, find_extractor, looks_like_text
+    )
+    from src.app.text_extractor import extract_text
+except ImportError:
+    import sys
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from src.app import extractor_registry
+    from src.app.extractor_registry import (
+        ExtractorSpec, register_extractor, get_extractor, find_extractor, looks_like_text
+    )
+    from src.app.text_extractor import extract_text
+
+
+class TestFindExtractor(unittest.TestCase):
+    """Test cases for the find_extractor function."""
+
+    def test_pdf_magic(self):
+        """Test that PDF content is recognized whatever the file is called."""
+        self.assertEqual(find_extractor("report.txt", b"%PDF-1.7\n%\xe2\xe3").name, "pdf")
+
+    def test_word_magic(self):
+        """Test that ZIP and OLE signatures go to the Word backend."""
+        self.assertEqual(find_extractor("file.bin", b"PK\x03\x04\x14\x00").name, "word")
+        self.assertEqual(find_extractor("file.bin", b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1\x00").name, "word")
+
+    def test_html_magic(self):
+        """Test that HTML is recognized after a byte order mark and whitespace."""
+        sample = b"\xef\xbb\xbf\n  <!DOCTYPE html><html><body>Hi</body></html>"
+        self.assertEqual(find_extractor("page.txt", sample).name, "html")
+
+    def test_text_with_binary_extension(self):
+        """Test that text mislabeled as PDF is read as plain text."""
+        self.assertEqual(find_extractor("notes.pdf", b"Just some plain text.").name, "txt")
+
+    def test_text_extension_kept_for_text(self):
+        """Test that text formats keep their own backend."""
+        self.assertEqual(find_extractor("README.md", b"# Title\n\nSome text").name, "markdown")
+        self.assertEqual(find_extractor("page.htm", b"<p>Fragment</p>").name, "html")
+
+    def test_empty_file_uses_extension(self):
+        """Test that an empty sample falls back to the extension."""
+        self.assertEqual(find_extractor("empty.pdf", b"").name, "pdf")
+        self.assertEqual(find_extractor("empty.docx", b"").name, "word")
+
+    def test_unknown_binary(self):
+        """Test that unrecognized binary content is unsupported."""
+        self.assertIsNone(find_extractor("image.xyz", b"\x89PNG\r\n\x1a\n\x00\x00"))
+
+    def test_unknown_extension_text(self):
+        """Test that text with an unknown extension is read as plain text."""
+        self.assertEqual(find_extractor("notes.log", b"started at noon").name, "txt")
+
+    def test_reads_sample_from_file(self):
+        """Test that the sample is read from disk when not given."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, "document.txt")
+            with open(path, 'wb') as f:
+                f.write(b"%PDF-1.4\n")
+            self.assertEqual(find_extractor(path).name, "pdf")
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_missing_file_uses_extension(self):
+        """Test that an unreadable file falls back to the extension."""
+        self.assertEqual(find_extractor("/nonexistent/file.md").name, "markdown")
+
+
+class TestLooksLikeText(unittest.TestCase):
+    """Test cases for the looks_like_text function."""
+
+    def test_utf8_text(self):
+        self.assertTrue(looks_like_text("Café au lait".encode('utf-8')))
+
+    def test_cut_off_character(self):
+        """Test that a multi-byte character cut off by the sample size is allowed."""
+        self.assertTrue(looks_like_text("Café".encode('utf-8')[:-1]))
+
+    def test_binary(self):
+        self.assertFalse(looks_like_text(b"abc\x00def"))
+        self.assertFalse(looks_like_text(b"\xff\xfe\xfd"))
+
+
+class TestRegisterExtractor(unittest.TestCase):
+    """Test cases for registering backends."""
+
+    def setUp(self):
+        self.saved = list(extractor_registry._extractors)
+
+    def tearDown(self):
+        extractor_registry._extractors[:] = self.saved
+
+    def test_register_new_format(self):
+        """Test that a registered format is sniffed and its backend loaded by name."""
+        spec = ExtractorSpec("json", "JSON", ["json"], "json", "loads", magic=[b"{"], text=True)
+        register_extractor(spec)
+
+        self.assertIs(find_extractor("data.txt", b'  {"a": 1}'), spec)
+        self.assertIs(spec.extract_function(), json.loads)
+        self.assertIsNone(spec.paragraph_reader())
+
+    def test_register_replaces_same_name(self):
+        """Test that registering a name again replaces the old backend."""
+        count = len(extractor_registry.registered_extractors())
+        spec = ExtractorSpec("txt", "Text", ["txt", "text"], ".text_extractor", "extract_text_from_txt")
+        register_extractor(spec)
+
+        self.assertEqual(len(extractor_registry.registered_extractors()), count)
+        self.assertIs(get_extractor("txt"), spec)
+
+    def test_capabilities(self):
+        """Test the capabilities advertised by the built-in backends."""
+        self.assertTrue(get_extractor("pdf").parallel)
+        self.assertTrue(get_extractor("html").streaming)
+        self.assertIsNone(get_extractor("word").paragraph_reader())
+
+
+class TestExtractTextSniffing(unittest.TestCase):
+    """Test cases for extract_text dispatch by content."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_mislabeled_text_file(self):
+        """Test that a text file named .pdf is read as text."""
+        path = os.path.join(self.temp_dir, "notes.pdf")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("Hello plain world")
+
+        self.assertEqual(extract_text(path), ["Hello", "plain", "world"])
+
+    def test_mislabeled_html_file(self):
+        """Test that an HTML file named .txt is read as HTML."""
+        path = os.path.join(self.temp_dir, "page.txt")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("<html><body><p>Hello</p><script>ignored()</script></body></html>")
+
+        self.assertEqual(extract_text(path), ["Hello"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Unit tests for the font_metrics module.
+"""
+
+import unittest
+import os
+
+try:
+    from src.app.font_metrics import FontMetrics
+except ImportError:
+    import sys
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from src.app.font_metrics import FontMetrics
+
+
+class FakeFont:
+    """Font stand-in with proportional widths that counts measure() calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def measure(self, text):
+        self.calls.append(text)
+        return sum(30 if char in "mw" else 10 for char in text)
+
+
+class TestFontMetrics(unittest.TestCase):
+    """Test cases for the FontMetrics class."""
+
+    def setUp(self):
+        self.font = FakeFont()
+
+    def test_measure_is_cached(self):
+        """Test that each string is measured by the font only once."""
+        metrics = FontMetrics(self.font)
+
+        self.assertEqual(metrics.measure("word"), 60)
+        self.assertEqual(metrics.measure("word"), 60)
+        self.assertEqual(self.font.calls, ["word"])
+
+    def test_least_recently_used_evicted(self):
+        """Test that the cache stays bounded and keeps recently used strings."""
+        metrics = FontMetrics(self.font, capacity=2)
+        metrics.measure("a")
+        metrics.measure("b")
+        metrics.measure("a")
+        metrics.measure("c")  # Evicts "b"
+
+        metrics.measure("a")
+        metrics.measure("b")
+        self.assertEqual(self.font.calls, ["a", "b", "c", "b"])
+
+    def test_center_bounds(self):
+        """Test that a letter is centered on the point whatever its width."""
+        metrics = FontMetrics(self.font)
+
+        self.assertEqual(metrics.center_bounds(100, "i"), (95, 105))
+        self.assertEqual(metrics.center_bounds(100, "m"), (85, 115))
+
+    def test_clear(self):
+        """Test that clearing forces widths to be measured again."""
+        metrics = FontMetrics(self.font)
+        metrics.measure("x")
+        metrics.clear()
+        metrics.measure("x")
+
+        self.assertEqual(self.font.calls, ["x", "x"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Unit tests for the frame_renderer module.
+"""
+
+import unittest
+import os
+import time
+
+try:
+    from src.app.frame_renderer import split_word, render_word_frame, FrameCache
+    from tests.helpers import wait_for
+except ImportError:
+    import sys
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from src.app.frame_renderer import split_word, render_word_frame, FrameCache
+    from tests.helpers import wait_for
+
+
+class TestSplitWord(unittest.TestCase):
+    """Test cases for the split_word function."""
+
+    def test_odd_length_word(self):
+        """Test that odd-length words split around the middle letter."""
+        self.assertEqual(split_word("hello"), ("he", "l", "lo"))
+
+    def test_even_length_word(self):
+        """Test that even-length words use the right-of-middle letter."""
+        self.assertEqual(split_word("test"), ("te", "s", "t"))
+
+    def test_single_character(self):
+        """Test that a single character is its own center."""
+        self.assertEqual(split_word("a"), ("", "a", ""))
+
+
+class TestRenderWordFrame(unittest.TestCase):
+    """Test cases for the render_word_frame function."""
+
+    def test_frame_size(self):
+        """Test that frames are rendered at the requested size."""
+        image = render_word_frame("hello", (300, 100))
+        self.assertEqual(image.size, (300, 100))
+
+    def test_center_letter_is_red(self):
+        """Test that the center letter is drawn in red around the frame center."""
+        image = render_word_frame("hello", (300, 100))
+        red_pixels = [
+            x for x in range(300)
+            for y in range(100)
+            if image.getpixel((x, y)) == (255, 0, 0)
+        ]
+        self.assertTrue(red_pixels)
+        self.assertLess(abs(sum(red_pixels) / len(red_pixels) - 150), 10)
+
+
+class TestFrameCache(unittest.TestCase):
+    """Test cases for the FrameCache class."""
+
+    def setUp(self):
+        self.words = ["word%d" % i for i in range(20)]
+        self.cache = FrameCache(self.words, (200, 60), capacity=4)
+
+    def tearDown(self):
+        self.cache.stop()
+
+    def test_renders_ahead(self):
+        """Test that frames are produced before playback asks for them."""
+        self.cache.start(0)
+        self.assertTrue(wait_for(lambda: self.cache._write_index == 4))
+        self.assertIsNotNone(self.cache.get(0))
+
+    def test_buffer_is_bounded(self):
+        """Test that the renderer never runs more than capacity frames ahead."""
+        self.cache.start(0)
+        wait_for(lambda: self.cache._write_index == 4)
+        time.sleep(0.05)
+        self.assertEqual(self.cache._write_index, 4)
+        self.cache.get(0)
+        self.assertTrue(wait_for(lambda: self.cache._write_index == 5))
+
+    def test_miss_skips_ahead(self):
+        """Test that a miss returns None and restarts rendering after that word."""
+        self.cache.start(0)
+        wait_for(lambda: self.cache._write_index == 4)
+        self.assertIsNone(self.cache.get(10))
+        self.assertTrue(wait_for(lambda: self.cache._write_index == 15))
+        self.assertIsNotNone(self.cache.get(11))
+
+    def test_seek_backwards(self):
+        """Test that seeking back re-renders frames from the new position."""
+        self.cache.start(8)
+        wait_for(lambda: self.cache._write_index == 12)
+        self.cache.seek(2)
+        self.assertTrue(wait_for(lambda: self.cache._write_index == 6))
+        self.assertIsNotNone(self.cache.get(2))
+
+
+if __name__ == '__main__':
+    unittest.main()
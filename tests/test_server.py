@@ -0,0 +1,180 @@
+"""
+Unit tests for the server module.
+"""
+
+import unittest
+import os
+import asyncio
+import json
+
+try:
+    from src.app.server import (
+        websocket_accept_key, encode_frame, read_frame, ClientConnection,
+        ReadingServer, run_load_test, run_server, OPCODE_CLOSE, OPCODE_TEXT
+    )
+except ImportError:
+    import sys
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from src.app.server import (
+        websocket_accept_key, encode_frame, read_frame, ClientConnection,
+        ReadingServer, run_load_test, run_server, OPCODE_CLOSE, OPCODE_TEXT
+    )
+
+
+async def decode(data):
+    """Read one frame back from encoded bytes."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return await read_frame(reader, max_payload=1 << 20)
+
+
+async def open_websocket(port):
+    """Open a WebSocket to a local server and return its reader and writer."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        b"GET /ws HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\n"
+        b"Connection: Upgrade\r\nSec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n"
+        b"Sec-WebSocket-Version: 13\r\n\r\n"
+    )
+    await writer.drain()
+    response = await reader.readuntil(b"\r\n\r\n")
+    return reader, writer, response
+
+
+class TestWebSocketFraming(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the WebSocket handshake and framing helpers."""
+
+    def test_accept_key(self):
+        """Test the handshake example from RFC 6455."""
+        self.assertEqual(websocket_accept_key("dGhlIHNhbXBsZSBub25jZQ=="), "s3pPLMBiTxaQ9kYGzzhZRbK+xOo=")
+
+    async def test_round_trip_small(self):
+        """Test that an unmasked frame decodes to its payload."""
+        self.assertEqual(await decode(encode_frame(b"hello")), (OPCODE_TEXT, b"hello"))
+
+    async def test_round_trip_masked(self):
+        """Test that a masked client frame is unmasked."""
+        data = encode_frame(b"hello", mask=True)
+        self.assertNotIn(b"hello", data)
+        self.assertEqual(await decode(data), (OPCODE_TEXT, b"hello"))
+
+    async def test_round_trip_extended_lengths(self):
+        """Test 16-bit and 64-bit payload lengths."""
+        for size in (126, 70000):
+            payload = b"x" * size
+            self.assertEqual(await decode(encode_frame(payload, mask=True)), (OPCODE_TEXT, payload))
+
+    async def test_frame_too_large(self):
+        """Test that oversized frames are rejected."""
+        reader = asyncio.StreamReader()
+        reader.feed_data(encode_frame(b"x" * 200))
+        with self.assertRaises(ConnectionError):
+            await read_frame(reader, max_payload=100)
+
+
+class TestClientConnection(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the per-client queue."""
+
+    async def test_full_queue_drops_oldest(self):
+        """Test that a slow client keeps the newest frames."""
+        client = ClientConnection(writer=None, queue_size=3)
+        for frame in (b"1", b"2", b"3", b"4", b"5"):
+            client.offer(frame)
+
+        self.assertEqual(client.dropped, 2)
+        self.assertEqual([client.queue.get_nowait() for _ in range(3)], [b"3", b"4", b"5"])
+
+
+class TestReadingServer(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the ReadingServer class."""
+
+    async def asyncSetUp(self):
+        self.words = ["alpha", "beta", "gamma", "delta"]
+        self.server = ReadingServer(self.words, wpm=6000, port=0)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.stop()
+
+    async def test_serves_client_page(self):
+        """Test that GET / returns the HTML client."""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        writer.write(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        response = await reader.read()
+        writer.close()
+
+        self.assertTrue(response.startswith(b"HTTP/1.1 200 OK"))
+        self.assertIn(b"new WebSocket", response)
+
+    async def test_unknown_path(self):
+        """Test that other paths return 404."""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        writer.write(b"GET /missing HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        response = await reader.read()
+        writer.close()
+
+        self.assertTrue(response.startswith(b"HTTP/1.1 404"))
+
+    async def test_broadcasts_ticks_in_order(self):
+        """Test that a client receives a hello, every word with its ORP index, then the end."""
+        reader, writer, response = await open_websocket(self.server.port)
+        self.assertIn(b"Sec-WebSocket-Accept: s3pPLMBiTxaQ9kYGzzhZRbK+xOo=", response)
+
+        events = []
+        while not events or events[-1]["type"] != "end":
+            opcode, payload = await asyncio.wait_for(read_frame(reader), 2.0)
+            events.append(json.loads(payload))
+
+        writer.write(encode_frame(b"\x03\xe8", OPCODE_CLOSE, mask=True))
+        opcode, _ = await asyncio.wait_for(read_frame(reader), 2.0)
+        writer.close()
+
+        self.assertEqual(events[0]["type"], "hello")
+        ticks = [event for event in events if event["type"] == "tick"]
+        self.assertEqual([tick["word"] for tick in ticks], self.words)
+        self.assertEqual([tick["orp"] for tick in ticks], [2, 2, 2, 2])
+        self.assertEqual([tick["position"] for tick in ticks], [0, 1, 2, 3])
+        self.assertEqual(ticks[0]["total"], 4)
+        self.assertEqual(opcode, OPCODE_CLOSE)
+
+    async def test_waits_for_first_client(self):
+        """Test that playback does not start before anyone connects."""
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.server.position, 0)
+        self.assertFalse(self.server.clients)
+
+
+class TestInvalidSpeed(unittest.TestCase):
+    """Test cases for speeds below 1 WPM."""
+
+    def test_rejected(self):
+        """Test that zero and negative speeds are refused before anything is served."""
+        for wpm in (0, -300):
+            self.assertIsNone(run_server(["word"], wpm, port=0))
+            with self.assertRaises(ValueError):
+                ReadingServer(["word"], wpm=wpm)
+
+
+class TestLoadTest(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the load generator."""
+
+    async def test_many_clients(self):
+        """Test that every client of a shared session follows it to the end."""
+        words = [f"word{i}" for i in range(20)]
+        server = ReadingServer(words, wpm=3000, port=0)
+        await server.start()
+        try:
+            stats = await run_load_test("127.0.0.1", server.port, clients=20, duration=5.0)
+        finally:
+            await server.stop()
+
+        self.assertEqual(stats["clients"], 20)
+        self.assertEqual(stats["failed"], 0)
+        self.assertEqual(stats["finished"], 20)
+        self.assertGreater(stats["ticks"], 0)
+        self.assertGreaterEqual(stats["p99_latency_ms"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
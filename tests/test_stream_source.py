@@ -0,0 +1,143 @@
+"""
+Unit tests for the stream_source module.
+"""
+
+import unittest
+import os
+import tempfile
+import threading
+import time
+
+try:
+    from src.app.stream_source import StreamSource, open_stream_source
+except ImportError:
+    import sys
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from src.app.stream_source import StreamSource, open_stream_source
+
+
+def collect(source, count, timeout=2.0):
+    """Collect up to count words from a source before the timeout expires."""
+    words = []
+    deadline = time.time() + timeout
+    while len(words) < count and time.time() < deadline:
+        words.extend(source.read_available())
+        time.sleep(0.01)
+    return words
+
+
+class TestStreamSource(unittest.TestCase):
+    """Test cases for the StreamSource class."""
+
+    def test_pipe_words_split_across_writes(self):
+        """Test that words and multibyte characters split between writes are joined."""
+        read_fd, write_fd = os.pipe()
+        source = StreamSource(os.fdopen(read_fd, 'rb'), poll_interval=0.05)
+        source.start()
+
+        os.write(write_fd, b"Hello wor")
+        os.write(write_fd, b"ld caf\xc3")
+        os.write(write_fd, b"\xa9 (end)")
+        os.close(write_fd)
+
+        self.assertEqual(list(source), ["Hello", "world", "café", "end"])
+        self.assertTrue(source.finished)
+
+    def test_words_arrive_before_eof(self):
+        """Test that words are available while the writer is still open."""
+        read_fd, write_fd = os.pipe()
+        source = StreamSource(os.fdopen(read_fd, 'rb'), poll_interval=0.05)
+        source.start()
+
+        try:
+            os.write(write_fd, b"live transcript ")
+            self.assertEqual(collect(source, 2), ["live", "transcript"])
+            self.assertFalse(source.finished)
+        finally:
+            os.close(write_fd)
+            source.stop()
+
+    def test_hyphen_held_until_next_word(self):
+        """Test that a hyphenated word is joined with a word that arrives later."""
+        read_fd, write_fd = os.pipe()
+        source = StreamSource(os.fdopen(read_fd, 'rb'), poll_interval=0.05)
+        source.start()
+
+        os.write(write_fd, b"inter- ")
+        time.sleep(0.1)
+        self.assertEqual(source.read_available(), [])
+        os.write(write_fd, b"national ")
+        os.close(write_fd)
+        self.assertEqual(list(source), ["international"])
+
+    def test_backpressure(self):
+        """Test that the reader stops reading when the buffer is full."""
+        read_fd, write_fd = os.pipe()
+        source = StreamSource(os.fdopen(read_fd, 'rb'), max_buffered_words=10,
+                              chunk_size=64, poll_interval=0.05)
+        source.start()
+        writer = threading.Thread(target=lambda: (os.write(write_fd, b"w " * 200000), os.close(write_fd)))
+        writer.start()
+
+        time.sleep(0.2)
+        self.assertLessEqual(source._words.qsize(), 10)
+        self.assertTrue(writer.is_alive())
+
+        self.assertEqual(len(list(source)), 200000)
+        writer.join()
+
+    def test_read_ahead_stalls_producer_while_paused(self):
+        """Test that a consumer paused at its position stops taking words and blocks the writer."""
+        read_fd, write_fd = os.pipe()
+        source = StreamSource(os.fdopen(read_fd, 'rb'), max_buffered_words=100,
+                              chunk_size=64, poll_interval=0.05)
+        source.start()
+        writer = threading.Thread(target=lambda: (os.write(write_fd, b"w " * 200000), os.close(write_fd)))
+        writer.start()
+
+        words = []
+        position = 0  # Playback paused at the first word
+        deadline = time.time() + 0.5
+        while time.time() < deadline:
+            words.extend(source.read_ahead(len(words) - position, lookahead=500))
+            time.sleep(0.01)
+        self.assertEqual(len(words), 500)
+        self.assertEqual(source._words.qsize(), 100)
+        self.assertTrue(writer.is_alive())
+
+        # Playback moving on lets words flow again
+        position = len(words)
+        deadline = time.time() + 2.0
+        while len(words) < 1000 and time.time() < deadline:
+            words.extend(source.read_ahead(len(words) - position, lookahead=500))
+            time.sleep(0.01)
+        self.assertEqual(len(words), 1000)
+
+        self.assertEqual(len(list(source)), 200000 - 1000)
+        writer.join()
+
+    def test_follow_growing_file(self):
+        """Test that follow mode picks up data appended to a file."""
+        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
+            f.write(b"first ")
+            temp_path = f.name
+
+        source = open_stream_source(temp_path, follow=True)
+        source.poll_interval = 0.05
+        try:
+            self.assertEqual(collect(source, 1), ["first"])
+            with open(temp_path, 'ab') as f:
+                f.write(b"second ")
+            self.assertEqual(collect(source, 1), ["second"])
+            self.assertFalse(source.finished)
+        finally:
+            source.stop()
+            os.unlink(temp_path)
+
+    def test_open_nonexistent_path(self):
+        """Test that a missing path returns None."""
+        self.assertIsNone(open_stream_source("/nonexistent/file.txt"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,8 +13,22 @@ try:
         extract_text_from_pdf,
         extract_text_from_txt,
         extract_text_from_word,
-        extract_text
+        extract_text,
+        split_paragraphs,
+        clean_paragraphs,
+        extract_paragraphs,
+        extract_document,
+        StreamingCleaner,
+        extract_text_from_html,
+        extract_text_from_markdown,
+        strip_markdown,
+        find_chunk_bounds,
+        clean_word_list_parallel,
+        split_long_paragraph,
+        find_paragraph_split,
+        MAX_PARAGRAPH_TOKENS
     )
+    from src.app.text_index import TextIndex
 except ImportError:
     import sys
     sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -23,8 +37,22 @@ except ImportError:
         extract_text_from_pdf,
         extract_text_from_txt,
         extract_text_from_word,
-        extract_text
+        extract_text,
+        split_paragraphs,
+        clean_paragraphs,
+        extract_paragraphs,
+        extract_document,
+        StreamingCleaner,
+        extract_text_from_html,
+        extract_text_from_markdown,
+        strip_markdown,
+        find_chunk_bounds,
+        clean_word_list_parallel,
+        split_long_paragraph,
+        find_paragraph_split,
+        MAX_PARAGRAPH_TOKENS
     )
+    from src.app.text_index import TextIndex
 
 
 class TestCleanWordList(unittest.TestCase):
@@ -89,6 +117,72 @@ class TestCleanWordList(unittest.TestCase):
         words = ["hello"]
         result = clean_word_list(words)
         self.assertEqual(result, ["hello"])
+    
+    def test_parenthesis_citations(self):
+        """Test that author-year citations are removed and their punctuation kept."""
+        words = "The claim (Smith et al., 2020). Next (born 1950) one (see Lee 2019a; Jones 2020, p. 4) end".split()
+        self.assertEqual(
+            clean_word_list(words, "parenthesis"),
+            ["The", "claim.", "Next", "born", "1950", "one", "end"]
+        )
+    
+    def test_numeric_citations(self):
+        """Test that bracketed numbers are removed, attached or not."""
+        words = "Law [3] applies[4, 5]. See [1-3] and [note]".split()
+        self.assertEqual(clean_word_list(words, "numeric"), ["Law", "applies.", "See", "and", "[note]"])
+    
+    def test_note_markers(self):
+        """Test that note numbers after punctuation and superscripts are removed."""
+        words = ["end.12", "Word\u00b9", "3.14", "COVID19"]
+        self.assertEqual(clean_word_list(words, "notes"), ["end.", "Word", "3.14", "COVID19"])
+    
+    def test_none_keeps_citations(self):
+        """Test that no citations are removed by default."""
+        words = ["claim", "[3]", "(Smith,", "2020)"]
+        self.assertEqual(clean_word_list(words), ["claim", "[3]", "Smith", "2020"])
+
+
+class TestCleanWordListParallel(unittest.TestCase):
+    """Test cases for parallel chunked cleaning."""
+    
+    WORDS = ["Hello", "(world,", "inter-", "national", "a-", "b-", "c", "...", "end-", "(of,", "line)"] * 50
+    
+    def test_chunk_bounds_avoid_hyphen_joins(self):
+        """Test that chunk boundaries never follow a word ending with '-'."""
+        bounds = find_chunk_bounds(self.WORDS, 16)
+        self.assertEqual(bounds[0][0], 0)
+        self.assertEqual(bounds[-1][1], len(self.WORDS))
+        for (start, end), (next_start, _) in zip(bounds, bounds[1:]):
+            self.assertEqual(end, next_start)
+            self.assertFalse(self.WORDS[end - 1].rstrip('(),').endswith('-'))
+    
+    def test_chunk_bounds_avoid_citations(self):
+        """Test that chunk boundaries never cut a citation apart."""
+        words = "Some claim (Smith et al., 2020). Then [1, 2] more inter- [3] national".split() * 40
+        for style in ("parenthesis", "numeric"):
+            chunked = []
+            for start, end in find_chunk_bounds(words, 16):
+                chunked.extend(clean_word_list(words[start:end], style))
+            self.assertEqual(chunked, clean_word_list(words, style))
+    
+    def test_chunks_clean_like_whole_list(self):
+        """Test that cleaning chunks separately matches cleaning the whole list."""
+        chunked = []
+        for start, end in find_chunk_bounds(self.WORDS, 16):
+            chunked.extend(clean_word_list(self.WORDS[start:end]))
+        self.assertEqual(chunked, clean_word_list(self.WORDS))
+    
+    def test_parallel_matches_serial(self):
+        """Test that the process pool gives the same result as clean_word_list."""
+        result = clean_word_list_parallel(self.WORDS, workers=2, min_words=1)
+        self.assertEqual(result, clean_word_list(self.WORDS))
+    
+    @patch('src.app.text_extractor.ProcessPoolExecutor')
+    def test_small_lists_stay_serial(self, mock_executor):
+        """Test that short lists and newline tokens skip the process pool."""
+        self.assertEqual(clean_word_list_parallel(["a", "b"], workers=2), ["a", "b"])
+        self.assertEqual(clean_word_list_parallel(["a\nb", "c"], workers=2, min_words=1), ["a\nb", "c"])
+        mock_executor.assert_not_called()
 
 
 class TestExtractTextFromTxt(unittest.TestCase):
@@ -298,5 +392,360 @@ class TestExtractText(unittest.TestCase):
             os.unlink(temp_path)
 
 
+class TestCleanParagraphs(unittest.TestCase):
+    """Test cases for split_paragraphs and clean_paragraphs."""
+    
+    def test_split_paragraphs(self):
+        """Test that blank lines separate paragraphs."""
+        text = "First line\nsame paragraph\n\n  \nSecond one\n"
+        self.assertEqual(
+            split_paragraphs(text),
+            [["First", "line", "same", "paragraph"], ["Second", "one"]]
+        )
+    
+    def test_matches_clean_word_list(self):
+        """Test that cleaning by paragraph gives the same words as cleaning everything."""
+        paragraphs = [["Hello", "(world,", "foo)"], ["...", "inter-"], ["national", "end."], ["a-", "b-"], ["c"]]
+        words, text_index = clean_paragraphs(paragraphs)
+        flat = [token for tokens in paragraphs for token in tokens]
+        self.assertEqual(words, clean_word_list(flat))
+        self.assertEqual(text_index.word_count, len(words))
+    
+    def test_paragraph_starts(self):
+        """Test that paragraph starts are recorded for each paragraph."""
+        words, text_index = clean_paragraphs([["One", "two."], ["Three"], ["...", "!!!"], ["Four"]])
+        self.assertEqual(words, ["One", "two.", "Three", "Four"])
+        self.assertEqual(list(text_index.paragraph_starts), [0, 2, 3])
+    
+    def test_filter_from_paragraph(self):
+        """Test that cleaning from a paragraph's source gives the tail of the full result."""
+        paragraphs = [["One", "two."], ["inter-"], ["national", "law."], ["...", "Four"], ["Five"]]
+        words, text_index = clean_paragraphs(paragraphs)
+        self.assertEqual(list(text_index.paragraph_sources), [0, 1, 3, 4])
+        for paragraph, source in enumerate(text_index.paragraph_sources):
+            tail, _ = clean_paragraphs(paragraphs[source:])
+            self.assertEqual(tail, words[text_index.paragraph_starts[paragraph]:])
+    
+    def test_first_source(self):
+        """Test that a slice of paragraphs keeps the raw paragraph numbers of the document."""
+        _, text_index = clean_paragraphs([["Three"], ["Four"]], first_source=2)
+        self.assertEqual(list(text_index.paragraph_sources), [2, 3])
+    
+    def test_repeated_style_switches(self):
+        """Test that switching citation style twice mid-document keeps paragraph sources intact."""
+        paragraphs = [[f"Word{i}", "(Smith,", f"{2000 + i})", "end."] for i in range(10)]
+        words, text_index = clean_paragraphs(paragraphs, "none")
+        
+        for style, position in (("parenthesis", 6 * 4), ("none", 8 * 2)):
+            # Re-filter from the reader's paragraph onward, then prepend the paragraphs before it
+            paragraph = text_index.paragraph_of(position)
+            source = text_index.paragraph_sources[paragraph]
+            tail, tail_index = clean_paragraphs(paragraphs[source:], style, first_source=source)
+            head, head_index = clean_paragraphs(paragraphs[:source], style)
+            previous_words = words
+            words, text_index = head + tail, head_index.join(tail_index)
+            
+            expected_words, expected_index = clean_paragraphs(paragraphs, style)
+            self.assertNotEqual(words, previous_words)
+            self.assertEqual(words, expected_words)
+            self.assertEqual(list(text_index.paragraph_sources), list(range(10)))
+            self.assertEqual(list(text_index.paragraph_starts), list(expected_index.paragraph_starts))
+    
+    def test_paragraph_slices_clean_like_whole(self):
+        """Test that slices ending at find_paragraph_split clean like the whole document."""
+        paragraphs = [["Start", "inter-"], ["national", "law."], ["A", "(Smith,"], ["2020)", "b."], ["Next"]] * 4
+        expected_words, expected_index = clean_paragraphs(paragraphs, "parenthesis")
+        
+        words, text_index = [], TextIndex()
+        start = 0
+        while start < len(paragraphs):
+            end = find_paragraph_split(paragraphs, start, 3)
+            self.assertNotIn(end % 5, (1, 3))  # Never inside a hyphen join or citation
+            part, part_index = clean_paragraphs(paragraphs[start:end], "parenthesis", first_source=start)
+            words.extend(part)
+            text_index = text_index.join(part_index)
+            start = end
+        
+        self.assertEqual(words, expected_words)
+        self.assertEqual(list(text_index.sentence_starts), list(expected_index.sentence_starts))
+        self.assertEqual(list(text_index.paragraph_sources), list(expected_index.paragraph_sources))
+    
+    def test_hyphen_across_paragraphs(self):
+        """Test that a word hyphenated across a break stays in one paragraph."""
+        words, text_index = clean_paragraphs([["Start", "inter-"], ["national", "law."], ["Next"]])
+        self.assertEqual(words, ["Start", "international", "law.", "Next"])
+        self.assertEqual(list(text_index.paragraph_starts), [0, 3])
+    
+    @patch('src.app.text_extractor.PARALLEL_BATCH_WORDS', 8)
+    def test_parallel_matches_serial(self):
+        """Test that cleaning on the process pool gives the same words and index."""
+        paragraphs = [["Intro", "(see", "note)."], []] + [
+            ["A", "sentence", "ends.", "inter-"], ["national", "law", "[3]."], ["Short", "one."]
+        ] * 20
+        expected_words, expected_index = clean_paragraphs(paragraphs, "parenthesis", first_source=4)
+        words, text_index = clean_paragraphs(paragraphs, "parenthesis", first_source=4, workers=2, min_words=5)
+        
+        self.assertEqual(words, expected_words)
+        self.assertEqual(list(text_index.sentence_starts), list(expected_index.sentence_starts))
+        self.assertEqual(list(text_index.paragraph_starts), list(expected_index.paragraph_starts))
+        self.assertEqual(list(text_index.paragraph_sources), list(expected_index.paragraph_sources))
+    
+    @patch('src.app.text_extractor.ProcessPoolExecutor')
+    def test_small_documents_stay_serial(self, mock_executor):
+        """Test that short documents, one worker and newline tokens skip the process pool."""
+        self.assertEqual(clean_paragraphs([["a", "b"]], workers=2)[0], ["a", "b"])
+        self.assertEqual(clean_paragraphs([["a", "b"]], workers=1, min_words=1)[0], ["a", "b"])
+        mock_executor.assert_not_called()
+        
+        words, text_index = clean_paragraphs([["a\nb"], ["c."]], workers=2, min_words=1)
+        self.assertEqual(words, ["a\nb", "c."])
+        self.assertEqual(list(text_index.paragraph_starts), [0, 1])
+        mock_executor.return_value.submit.assert_not_called()
+
+
+class TestStreamingCleaner(unittest.TestCase):
+    """Test cases for the StreamingCleaner class."""
+    
+    def test_matches_clean_word_list(self):
+        """Test that feeding tokens in pieces gives the same words as cleaning them at once."""
+        tokens = ["Hello", "(world,", "inter-", "...", "national", "a-", "b-", "c", "end"]
+        cleaner = StreamingCleaner()
+        words = []
+        for token in tokens:
+            words.extend(cleaner.feed([token]))
+        words.extend(cleaner.close())
+        self.assertEqual(words, clean_word_list(tokens))
+    
+    def test_holds_back_hyphenated_word(self):
+        """Test that a word ending with '-' waits for the next token."""
+        cleaner = StreamingCleaner()
+        self.assertEqual(cleaner.feed(["one", "inter-"]), ["one"])
+        self.assertEqual(cleaner.feed(["national"]), ["international"])
+        self.assertEqual(cleaner.close(), [])
+    
+    def test_citation_across_feeds(self):
+        """Test that a citation arriving in pieces is removed like in one piece."""
+        tokens = "A claim (Smith, 2020). More inter- (Lee 2019) national [1, 2] words.".split()
+        for style in ("parenthesis", "numeric"):
+            cleaner = StreamingCleaner(style)
+            words = []
+            for token in tokens:
+                words.extend(cleaner.feed([token]))
+            words.extend(cleaner.close())
+            self.assertEqual(words, clean_word_list(tokens, style))
+
+
+class TestExtractTextFromHtml(unittest.TestCase):
+    """Test cases for HTML extraction."""
+    
+    def write_html(self, html):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
+            f.write(html)
+            return f.name
+    
+    def test_extract_html(self):
+        """Test that visible text is extracted and skipped blocks are dropped."""
+        temp_path = self.write_html(
+            "<html><head><title>T</title><style>p {}</style></head><body>"
+            "<nav>Home About</nav><p>Hello <b>bold</b>world &amp; more</p>"
+            "<script>var x = 1;</script><pre><code>code here</code></pre>"
+            "<p>Last<br>line</p></body></html>"
+        )
+        try:
+            result = extract_text_from_html(temp_path)
+            self.assertEqual(result, ["Hello", "boldworld", "more", "Last", "line"])
+        finally:
+            os.unlink(temp_path)
+    
+    def test_head_without_end_tag(self):
+        """Test that a document whose </head> is omitted is still read."""
+        temp_path = self.write_html("<html><head><title>t</title><body><p>text</p>")
+        try:
+            self.assertEqual(extract_paragraphs(temp_path), [["text"]])
+        finally:
+            os.unlink(temp_path)
+    
+    def test_blocks_separate_words(self):
+        """Test that block elements break words and paragraphs."""
+        temp_path = self.write_html("<div>one</div><div>two</div>")
+        try:
+            self.assertEqual(extract_paragraphs(temp_path), [["one"], ["two"]])
+        finally:
+            os.unlink(temp_path)
+    
+    def test_words_across_chunks(self):
+        """Test that words split across read chunks stay whole."""
+        temp_path = self.write_html("<p>" + "abcdefg " * 20000 + "</p>")
+        try:
+            result = extract_text_from_html(temp_path)
+            self.assertEqual(len(result), 20000)
+            self.assertEqual(set(result), {"abcdefg"})
+        finally:
+            os.unlink(temp_path)
+    
+    def test_long_paragraph_is_split(self):
+        """Test that text without block tags is split into bounded paragraphs."""
+        text = "A sentence with inter- national words. " * 3000
+        temp_path = self.write_html("<body>" + text + "</body>")
+        try:
+            paragraphs = extract_paragraphs(temp_path)
+            self.assertGreater(len(paragraphs), 1)
+            self.assertTrue(all(len(tokens) <= MAX_PARAGRAPH_TOKENS for tokens in paragraphs))
+            self.assertEqual([token for tokens in paragraphs for token in tokens], text.split())
+            self.assertEqual(extract_text_from_html(temp_path), clean_word_list(text.split()))
+        finally:
+            os.unlink(temp_path)
+
+
+class TestExtractTextFromMarkdown(unittest.TestCase):
+    """Test cases for Markdown extraction."""
+    
+    def test_strip_markdown(self):
+        """Test removal of inline Markdown syntax."""
+        self.assertEqual(
+            strip_markdown("- **Bold** and _it_ with [a link](http://x) `code` ![img](y.png)").split(),
+            ["Bold", "and", "it", "with", "a", "link"]
+        )
+        self.assertEqual(strip_markdown("keep snake_case words").split(), ["keep", "snake_case", "words"])
+    
+    def test_extract_markdown(self):
+        """Test that headings, paragraphs and code blocks are handled."""
+        markdown = (
+            "---\ntitle: Notes\n---\n"
+            "# Heading\n"
+            "First paragraph\ncontinues here.\n\n"
+            "```python\nprint('skipped')\n```\n\n"
+            "    indented code\n\n"
+            "> Quoted text\n\n"
+            "***\n"
+            "[ref]: http://example.com\n"
+        )
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8') as f:
+            f.write(markdown)
+            temp_path = f.name
+        
+        try:
+            self.assertEqual(
+                extract_paragraphs(temp_path),
+                [["Heading"], ["First", "paragraph", "continues", "here."], ["Quoted", "text"]]
+            )
+            self.assertEqual(
+                extract_text_from_markdown(temp_path),
+                ["Heading", "First", "paragraph", "continues", "here.", "Quoted", "text"]
+            )
+        finally:
+            os.unlink(temp_path)
+    
+    def test_list_continuation_is_text(self):
+        """Test that indented paragraphs and nested items of a list are not read as code."""
+        markdown = (
+            "- item one\n\n"
+            "    continued text\n\n"
+            "    - nested item\n\n"
+            "After list\n\n"
+            "    real code\n"
+        )
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8') as f:
+            f.write(markdown)
+            temp_path = f.name
+        
+        try:
+            self.assertEqual(
+                extract_paragraphs(temp_path),
+                [["item", "one"], ["continued", "text"], ["nested", "item"], ["After", "list"]]
+            )
+        finally:
+            os.unlink(temp_path)
+
+
+class TestExtractParagraphs(unittest.TestCase):
+    """Test cases for extract_paragraphs and extract_document."""
+    
+    def test_extract_txt_paragraphs(self):
+        """Test reading paragraphs from a text file."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
+            f.write("Hello world.\n\nSecond paragraph here.")
+            temp_path = f.name
+        
+        try:
+            self.assertEqual(
+                extract_paragraphs(temp_path),
+                [["Hello", "world."], ["Second", "paragraph", "here."]]
+            )
+        finally:
+            os.unlink(temp_path)
+    
+    def test_long_txt_paragraph_is_split(self):
+        """Test that a text without blank lines or line breaks is read in bounded paragraphs."""
+        text = "Some words, then a hyphen- ated one. " * 4000
+        for content in (text, text.replace(". ", ".\n")):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
+                f.write(content)
+                temp_path = f.name
+            
+            try:
+                paragraphs = extract_paragraphs(temp_path)
+                self.assertGreater(len(paragraphs), 1)
+                self.assertTrue(all(len(tokens) <= MAX_PARAGRAPH_TOKENS for tokens in paragraphs))
+                self.assertTrue(all(tokens[-1] == "one." for tokens in paragraphs))
+                self.assertEqual([token for tokens in paragraphs for token in tokens], text.split())
+                
+                words, _ = extract_document(temp_path)
+                self.assertEqual(words, clean_word_list(text.split()))
+            finally:
+                os.unlink(temp_path)
+    
+    def test_split_long_paragraph(self):
+        """Test that paragraphs are split after a sentence end, never after a hyphen."""
+        self.assertEqual(split_long_paragraph(["a", "b", "c"], 3), 0)
+        self.assertEqual(split_long_paragraph(["One.", "two", "three", "four"], 3), 1)
+        self.assertEqual(split_long_paragraph(["one", "two", "inter-", "national"], 3), 2)
+        self.assertEqual(split_long_paragraph(["a-", "b-", "c-", "d"], 3), 0)
+    
+    @patch('src.app.text_extractor.fitz')
+    def test_pdf_pages_are_paragraphs(self, mock_fitz):
+        """Test that every PDF page starts a new paragraph."""
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+            temp_path = f.name
+        
+        mock_doc = MagicMock()
+        mock_doc.__len__ = lambda self: 2
+        pages = [MagicMock(), MagicMock()]
+        pages[0].get_text.return_value = "Page one text"
+        pages[1].get_text.return_value = "Page two"
+        mock_doc.__getitem__ = lambda self, idx: pages[idx]
+        mock_fitz.open.return_value = mock_doc
+        
+        try:
+            words, text_index = extract_document(temp_path)
+            self.assertEqual(words, ["Page", "one", "text", "Page", "two"])
+            self.assertEqual(list(text_index.paragraph_starts), [0, 3])
+        finally:
+            os.unlink(temp_path)
+    
+    def test_extract_document_keeps_raw_paragraphs(self):
+        """Test that the raw tokens are collected while the document is cleaned."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
+            f.write("A claim (Smith, 2020) holds.\n\nSecond one.")
+            temp_path = f.name
+        
+        try:
+            raw_paragraphs = []
+            words, _ = extract_document(temp_path, "parenthesis", raw_paragraphs=raw_paragraphs)
+            self.assertEqual(words, ["A", "claim", "holds.", "Second", "one."])
+            self.assertEqual(raw_paragraphs, [["A", "claim", "(Smith,", "2020)", "holds."], ["Second", "one."]])
+            self.assertEqual(
+                clean_paragraphs(raw_paragraphs)[0],
+                ["A", "claim", "Smith", "2020", "holds.", "Second", "one."]
+            )
+        finally:
+            os.unlink(temp_path)
+    
+    def test_extract_paragraphs_nonexistent_file(self):
+        """Test that a missing file returns None."""
+        self.assertIsNone(extract_paragraphs("/nonexistent/file.txt"))
+        self.assertIsNone(extract_document("/nonexistent/file.txt"))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,106 @@
+"""
+Unit tests for the text_index module.
+"""
+
+import unittest
+import os
+
+try:
+    from src.app.text_index import TextIndex, ends_sentence, find_sentence_starts
+except ImportError:
+    import sys
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from src.app.text_index import TextIndex, ends_sentence, find_sentence_starts
+
+
+class TestEndsSentence(unittest.TestCase):
+    """Test cases for the ends_sentence function."""
+
+    def test_terminal_punctuation(self):
+        """Test that periods, exclamation and question marks end sentences."""
+        self.assertTrue(ends_sentence("end."))
+        self.assertTrue(ends_sentence("really?"))
+        self.assertTrue(ends_sentence("wow!"))
+
+    def test_closing_quote(self):
+        """Test that a closing quote after the punctuation still ends the sentence."""
+        self.assertTrue(ends_sentence('said."'))
+
+    def test_plain_word_and_abbreviation(self):
+        """Test that plain words and common abbreviations do not end sentences."""
+        self.assertFalse(ends_sentence("word"))
+        self.assertFalse(ends_sentence("Dr."))
+        self.assertFalse(ends_sentence("e.g."))
+
+
+class TestFindSentenceStarts(unittest.TestCase):
+    """Test cases for the find_sentence_starts function."""
+
+    def test_sentences(self):
+        """Test sentence starts from punctuation."""
+        words = ["One", "two.", "Three", "four?", "Five"]
+        self.assertEqual(list(find_sentence_starts(words)), [0, 2, 4])
+
+    def test_paragraph_starts_sentence(self):
+        """Test that a paragraph start begins a sentence even without punctuation."""
+        words = ["Heading", "Body", "text."]
+        self.assertEqual(list(find_sentence_starts(words, [0, 1])), [0, 1])
+
+    def test_empty(self):
+        """Test that an empty word list has no sentences."""
+        self.assertEqual(list(find_sentence_starts([])), [])
+
+
+class TestTextIndex(unittest.TestCase):
+    """Test cases for TextIndex navigation."""
+
+    def setUp(self):
+        # Sentences start at 0, 3, 6 and 8; paragraphs at 0 and 6
+        words = ["A", "b", "c.", "D", "e", "f.", "G", "h.", "I", "j."]
+        self.index = TextIndex(find_sentence_starts(words, [0, 6]), [0, 6], len(words))
+
+    def test_previous_sentence_mid_sentence(self):
+        """Test that rewinding mid-sentence goes to the sentence start."""
+        self.assertEqual(self.index.previous_sentence(4), 3)
+
+    def test_previous_sentence_at_start(self):
+        """Test that rewinding at a sentence start goes to the previous sentence."""
+        self.assertEqual(self.index.previous_sentence(3), 0)
+        self.assertEqual(self.index.previous_sentence(0), 0)
+
+    def test_next_sentence(self):
+        """Test skipping to the next sentence and past the last one."""
+        self.assertEqual(self.index.next_sentence(3), 6)
+        self.assertEqual(self.index.next_sentence(9), 10)
+
+    def test_paragraph_navigation(self):
+        """Test paragraph rewind and skip."""
+        self.assertEqual(self.index.previous_paragraph(8), 6)
+        self.assertEqual(self.index.previous_paragraph(6), 0)
+        self.assertEqual(self.index.next_paragraph(2), 6)
+        self.assertEqual(self.index.next_paragraph(7), 10)
+
+    def test_paragraph_of(self):
+        """Test finding the paragraph containing a word."""
+        self.assertEqual(self.index.paragraph_of(0), 0)
+        self.assertEqual(self.index.paragraph_of(5), 0)
+        self.assertEqual(self.index.paragraph_of(9), 1)
+
+    def test_join(self):
+        """Test combining the indexes of consecutive word lists."""
+        head = TextIndex(self.index.sentence_starts, self.index.paragraph_starts, 10, [0, 2])
+        tail = TextIndex([0, 1], [0], 2, [5])
+        joined = head.join(tail)
+        self.assertEqual(joined.word_count, 12)
+        self.assertEqual(list(joined.sentence_starts), [0, 3, 6, 8, 10, 11])
+        self.assertEqual(list(joined.paragraph_starts), [0, 6, 10])
+        self.assertEqual(list(joined.paragraph_sources), [0, 2, 5])
+
+    def test_compact_storage(self):
+        """Test that boundaries are stored as compact arrays."""
+        self.assertEqual(self.index.sentence_starts.typecode, 'L')
+        self.assertEqual(list(self.index.paragraph_starts), [0, 6])
+
+
+if __name__ == '__main__':
+    unittest.main()
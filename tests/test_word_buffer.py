@@ -0,0 +1,90 @@
+"""
+Unit tests for the word_buffer module.
+"""
+
+import unittest
+import os
+import tempfile
+
+try:
+    from src.app.word_buffer import WordBuffer
+    from src.app.text_extractor import extract_document
+    from tests.helpers import wait_for
+except ImportError:
+    import sys
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from src.app.word_buffer import WordBuffer
+    from src.app.text_extractor import extract_document
+    from tests.helpers import wait_for
+
+
+class TestWordBuffer(unittest.TestCase):
+    """Test cases for the WordBuffer class."""
+
+    def setUp(self):
+        self.words = ["word%d" % i for i in range(1000)]
+        self.buffer = WordBuffer(segment_size=10, segments_behind=1, segments_ahead=2)
+        self.buffer.extend(self.words)
+
+    def tearDown(self):
+        self.buffer.close()
+
+    def test_indexing_matches_list(self):
+        """Test that every index returns the same word as the original list."""
+        self.assertEqual(len(self.buffer), 1000)
+        self.assertEqual([self.buffer[i] for i in range(1000)], self.words)
+        self.assertEqual(list(self.buffer), self.words)
+
+    def test_negative_and_out_of_range(self):
+        """Test negative indices and out of range errors."""
+        self.assertEqual(self.buffer[-1], "word999")
+        with self.assertRaises(IndexError):
+            self.buffer[1000]
+
+    def test_memory_is_bounded(self):
+        """Test that only the window around the reading position stays in memory."""
+        for i in range(1000):
+            self.buffer[i]
+            self.assertLessEqual(self.buffer.resident_words, 40)
+
+    def test_prefetch_ahead(self):
+        """Test that segments ahead of the reading position are loaded in the background."""
+        self.buffer[500]
+        self.assertTrue(wait_for(lambda: set(self.buffer._segments) == {49, 50, 51, 52}))
+
+    def test_jump_back(self):
+        """Test that jumping back to an evicted segment reads it from disk."""
+        self.buffer[900]
+        self.assertEqual(self.buffer[5], "word5")
+
+    def test_empty_and_tail(self):
+        """Test an empty buffer and words that do not fill a whole segment."""
+        buffer = WordBuffer(segment_size=10)
+        try:
+            self.assertEqual(len(buffer), 0)
+            self.assertFalse(buffer)
+            buffer.extend(["a", "b", "c"])
+            self.assertEqual(len(buffer), 3)
+            self.assertEqual(buffer[2], "c")
+        finally:
+            buffer.close()
+
+    def test_extract_document_into_buffer(self):
+        """Test that a document can be extracted straight into a word buffer."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
+            f.write("One two three.\n\nFour five six seven.")
+            temp_path = f.name
+
+        buffer = WordBuffer(segment_size=2)
+        try:
+            words, text_index = extract_document(temp_path, words=buffer)
+            self.assertIs(words, buffer)
+            self.assertEqual(list(words), ["One", "two", "three.", "Four", "five", "six", "seven."])
+            self.assertEqual(list(text_index.paragraph_starts), [0, 3])
+        finally:
+            buffer.close()
+            os.unlink(temp_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
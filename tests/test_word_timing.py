@@ -0,0 +1,154 @@
+"""
+Unit tests for the word_timing module.
+"""
+
+import unittest
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+try:
+    from src.app.word_timing import (
+        fnv1a_32, build_lexicon, Lexicon, get_lexicon, word_weight, word_weights, AdaptiveTimer,
+        WORD_LIST_PATH
+    )
+except ImportError:
+    import sys
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from src.app.word_timing import (
+        fnv1a_32, build_lexicon, Lexicon, get_lexicon, word_weight, word_weights, AdaptiveTimer,
+        WORD_LIST_PATH
+    )
+
+
+class TestFnv1a(unittest.TestCase):
+    """Test cases for the fnv1a_32 function."""
+
+    def test_known_values(self):
+        """Test against the published FNV-1a test vectors."""
+        self.assertEqual(fnv1a_32(b"a"), 0xE40C292C)
+        self.assertEqual(fnv1a_32(b"foobar"), 0xBF9CF968)
+
+    def test_empty_is_offset_basis(self):
+        self.assertEqual(fnv1a_32(b""), 0x811C9DC5)
+
+
+class TestLexicon(unittest.TestCase):
+    """Test cases for building and reading lexicon files."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "words.bin")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_round_trip(self):
+        """Test that every word gets its rank back and others are missing."""
+        words = [f"word{i}" for i in range(300)]
+        self.assertEqual(build_lexicon(words, self.path), 300)
+
+        lexicon = Lexicon(self.path)
+        for rank, word in enumerate(words, start=1):
+            self.assertEqual(lexicon.rank(word), rank)
+        self.assertIsNone(lexicon.rank("missing"))
+        self.assertEqual(lexicon.word_count, 300)
+
+    def test_words_are_normalized(self):
+        """Test that case, punctuation and duplicates are folded when building."""
+        build_lexicon(["The", "of", "the.", "And"], self.path)
+        lexicon = Lexicon(self.path)
+
+        self.assertEqual(lexicon.rank("the"), 1)
+        self.assertEqual(lexicon.rank("and"), 3)
+        self.assertIn("of", lexicon)
+
+    def test_loaded_on_first_lookup(self):
+        """Test that the file is not read until a word is looked up."""
+        lexicon = Lexicon(os.path.join(self.temp_dir, "missing.bin"))
+        with self.assertRaises(OSError):
+            lexicon.rank("the")
+
+    def test_rejects_other_files(self):
+        """Test that a file without the lexicon header is rejected."""
+        with open(self.path, 'wb') as f:
+            f.write(b"\x00" * 64)
+        with self.assertRaises(ValueError):
+            Lexicon(self.path).rank("the")
+
+    def test_bundled_lexicon_matches_word_list(self):
+        """Test that the bundled lexicon is up to date with its word list."""
+        with open(WORD_LIST_PATH, 'r', encoding='utf-8') as f:
+            words = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+        lexicon = get_lexicon()
+        self.assertEqual(lexicon.rank("the"), 1)
+        self.assertEqual(lexicon.rank(words[-1]), len(words))
+
+
+class TestWordWeights(unittest.TestCase):
+    """Test cases for the word_weights function."""
+
+    def test_average_is_one(self):
+        """Test that weights keep the average speed."""
+        weights = word_weights("The committee postponed its deliberations, again.".split())
+        self.assertAlmostEqual(sum(weights) / len(weights), 1.0, places=5)
+
+    def test_relative_order(self):
+        """Test that rare, long and sentence-ending words are shown longer."""
+        common, rare, sentence_end = word_weights(["the", "incomprehensibility", "the."])
+        self.assertLess(common, rare)
+        self.assertLess(common, sentence_end)
+
+    def test_empty(self):
+        self.assertEqual(len(word_weights([])), 0)
+
+
+class TestAdaptiveTimer(unittest.TestCase):
+    """Test cases for the AdaptiveTimer class."""
+
+    def test_total_matches_uniform_pace(self):
+        """Test that a chunk takes as long as it would at a uniform pace."""
+        words = ("A quick survey of extraordinarily heterogeneous phenomena. " * 8).split()
+        timer = AdaptiveTimer(words, chunk_size=len(words))
+
+        total = sum(timer.delay_ms(index, 300) for index in range(len(words)))
+        self.assertAlmostEqual(total, len(words) * 200, delta=len(words))
+
+    def test_growing_word_list(self):
+        """Test that words appended after a chunk was timed get timings too."""
+        words = ["one", "two"]
+        timer = AdaptiveTimer(words, chunk_size=8)
+        timer.weight(1)
+
+        words.extend(["three", "four"])
+        self.assertGreater(timer.weight(3), 0)
+
+    def test_growing_chunk_times_only_new_words(self):
+        """Test that shown words keep their timing and only new words are weighed."""
+        words = ["alpha", "beta", "gamma"]
+        timer = AdaptiveTimer(words, chunk_size=6)
+        shown = [timer.weight(index) for index in range(3)]
+
+        words.extend(["delta", "epsilon"])
+        with patch('src.app.word_timing.word_weight', wraps=word_weight) as mock_weight:
+            timer.weight(4)
+        self.assertEqual(sorted(call.args[0] for call in mock_weight.call_args_list), ["delta", "epsilon"])
+        self.assertEqual([timer.weight(index) for index in range(3)], shown)
+
+    def test_full_chunk_is_normalized(self):
+        """Test that a chunk filled word by word ends up averaging 1."""
+        words = []
+        timer = AdaptiveTimer(words, chunk_size=4)
+        for word in "The committee postponed deliberations.".split():
+            words.append(word)
+            timer.weight(len(words) - 1)
+
+        weights = [timer.weight(index) for index in range(4)]
+        self.assertAlmostEqual(sum(weights) / 4, 1.0, places=5)
+        self.assertEqual(weights, list(word_weights(words)))
+
+
+if __name__ == '__main__':
+    unittest.main()